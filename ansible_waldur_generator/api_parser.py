@@ -1,8 +1,14 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 from .models import ApiOperation
 from .helpers import ValidationErrorCollector
 
+# The keys of an OpenAPI path item that hold operations. The others, such as
+# `parameters` or `summary`, describe the path itself.
+HTTP_METHODS = frozenset(
+    ("get", "put", "post", "delete", "options", "head", "patch", "trace")
+)
+
 
 class ApiSpecParser:
     """
@@ -21,6 +27,19 @@ class ApiSpecParser:
         """
         self.api_spec = api_spec_data
         self.collector = collector
+        # Index every operation by its operationId once, so lookups do not walk all
+        # paths of the specification. The first definition of a duplicate ID wins.
+        self._operations: Dict[str, Tuple[str, str, Dict[str, Any]]] = {}
+        for path, methods in self.api_spec.get("paths", {}).items():
+            for method, operation in methods.items():
+                if method not in HTTP_METHODS:
+                    continue
+                operation_id = operation.get("operationId")
+                if operation_id is None:
+                    continue
+                self._operations.setdefault(operation_id, (path, method, operation))
+        # Schemas already resolved by `get_schema_by_ref`, keyed by their $ref.
+        self._schemas_by_ref: Dict[str, Dict[str, Any]] = {}
 
     def get_operation(self, operation_id: str) -> Optional[ApiOperation]:
         """
@@ -32,39 +51,35 @@ class ApiSpecParser:
         Returns:
             An ApiOperation object if the operation is found, otherwise None.
         """
-        for path, methods in self.api_spec.get("paths", {}).items():
-            for method, operation in methods.items():
-                if operation.get("operationId") != operation_id:
-                    continue
-
-                model_schema = None
-                request_body_schema = (
-                    operation.get("requestBody", {})
-                    .get("content", {})
-                    .get("application/json", {})
-                    .get("schema", {})
-                )
-                if request_body_schema:
-                    schema_ref = request_body_schema.get("$ref")
-                    if schema_ref:
-                        try:
-                            model_schema = self.get_schema_by_ref(schema_ref)
-                        except ValueError as e:
-                            self.collector.add_error(
-                                f"For operation '{operation_id}': {e}"
-                            )
-                            return None
-                    else:
-                        model_schema = request_body_schema
-
-                return ApiOperation(
-                    path=path,
-                    method=method.upper(),
-                    operation_id=operation_id,
-                    model_schema=model_schema,
-                    raw_spec=operation,
-                )
-        return None
+        if operation_id not in self._operations:
+            return None
+        path, method, operation = self._operations[operation_id]
+
+        model_schema = None
+        request_body_schema = (
+            operation.get("requestBody", {})
+            .get("content", {})
+            .get("application/json", {})
+            .get("schema", {})
+        )
+        if request_body_schema:
+            schema_ref = request_body_schema.get("$ref")
+            if schema_ref:
+                try:
+                    model_schema = self.get_schema_by_ref(schema_ref)
+                except ValueError as e:
+                    self.collector.add_error(f"For operation '{operation_id}': {e}")
+                    return None
+            else:
+                model_schema = request_body_schema
+
+        return ApiOperation(
+            path=path,
+            method=method.upper(),
+            operation_id=operation_id,
+            model_schema=model_schema,
+            raw_spec=operation,
+        )
 
     def get_schema_by_ref(self, ref: str) -> Dict[str, Any]:
         """
@@ -79,6 +94,9 @@ class ApiSpecParser:
         Raises:
             ValueError: If the reference is invalid or cannot be resolved.
         """
+        if ref in self._schemas_by_ref:
+            return self._schemas_by_ref[ref]
+
         parts = ref.lstrip("#/").split("/")
         schema = self.api_spec
         for part in parts:
@@ -87,6 +105,7 @@ class ApiSpecParser:
                 raise ValueError(
                     f"Invalid $ref, part '{part}' not found in spec: {ref}"
                 )
+        self._schemas_by_ref[ref] = schema
         return schema
 
     def get_query_parameters_for_operation(self, operation_id: str) -> Dict[str, Any]:
@@ -101,19 +120,9 @@ class ApiSpecParser:
             A dictionary mapping parameter names to their full parameter definitions.
             Returns an empty dictionary if the operation is not found or has no parameters.
         """
-        operation_spec = None
-        # This is a bit inefficient, but reuses existing logic to find the operation spec.
-        # A more optimized version could cache these lookups.
-        for path, methods in self.api_spec.get("paths", {}).items():
-            for method, operation in methods.items():
-                if operation.get("operationId") == operation_id:
-                    operation_spec = operation
-                    break
-            if operation_spec:
-                break
-
-        if not operation_spec:
+        if operation_id not in self._operations:
             return {}
+        operation_spec = self._operations[operation_id][2]
 
         query_params = {}
         for param in operation_spec.get("parameters", []):
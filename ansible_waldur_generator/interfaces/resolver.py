@@ -13,8 +13,6 @@ composition, leveraging the runner's access to the Ansible module, its context,
 and its API request helper.
 """
 
-from copy import deepcopy
-
 
 class ParameterResolver:
     """
@@ -43,6 +41,9 @@ class ParameterResolver:
         self.runner = runner
         self.module = runner.module
         self.context = runner.context
+        # The resolver configurations, looked up once since `resolve` reads them
+        # at every level of its recursion.
+        self.resolvers = self.context.get("resolvers", {})
 
         # The cache is a critical component for both performance and functionality.
         # - Performance: It stores the full API responses of resolved objects, so if the same
@@ -93,7 +94,7 @@ class ParameterResolver:
             The fully qualified URL of the resolved resource.
         """
         # Retrieve the specific resolver configuration for this parameter from the context.
-        resolver_conf = self.context.get("resolvers", {}).get(param_name)
+        resolver_conf = self.resolvers.get(param_name)
         if not resolver_conf:
             self.module.fail_json(
                 msg=f"Configuration error: No resolver found for parameter '{param_name}'."
@@ -170,21 +171,26 @@ class ParameterResolver:
             The fully resolved data structure, with all names/UUIDs replaced by
             their API-ready, formatted values.
         """
-        resolver_conf = self.context["resolvers"].get(param_name)
+        resolver_conf = self.resolvers.get(param_name)
+        if resolver_conf is None and "resolvers" not in self.context:
+            # Every generated context defines its resolvers, even if empty; without
+            # them nothing would be resolved and values would pass through silently.
+            self.module.fail_json(
+                msg="Internal configuration error: the module context defines no resolvers."
+            )
 
         # --- Recursive Cases ---
 
         # Case 1: The value is a dictionary (e.g., a single item from a `ports` list).
         if isinstance(param_value, dict):
-            resolved_dict = deepcopy(param_value)
-            # Iterate through the dictionary's items and recurse. The dictionary key
-            # becomes the new `param_name` context for the next level down.
-            for key, value in param_value.items():
+            # Build a new dictionary by recursing into each item; the dictionary key
+            # becomes the new `param_name` context for the next level down. Every
+            # value is replaced, so the input is never copied or modified.
+            return {
                 # Pass the hint down during recursion
-                resolved_dict[key] = self.resolve(
-                    key, value, output_format=output_format
-                )
-            return resolved_dict
+                key: self.resolve(key, value, output_format=output_format)
+                for key, value in param_value.items()
+            }
 
         # Case 2: The value is a list.
         if isinstance(param_value, list):
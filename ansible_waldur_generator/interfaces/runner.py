@@ -38,6 +38,9 @@ class BaseRunner:
         # Holds the `info` dict (status + headers) of the most recent request.
         # Used to read pagination metadata such as the 'Link' header.
         self._last_response_info = {}
+        # Standard request headers, built on the first request and then reused
+        # since the credentials do not change during a module run.
+        self._request_headers = None
 
     @abstractmethod
     def plan_creation(self) -> list:
@@ -256,11 +259,13 @@ class BaseRunner:
         if data and not isinstance(data, str):
             data = self.module.jsonify(data)
 
-        # Define the standard headers for all API requests.
-        headers = {
-            "Authorization": f"token {self.module.params['access_token']}",
-            "Content-Type": "application/json",
-        }
+        # Define the standard headers for all API requests. `fetch_url` copies
+        # them into each request, so the same dictionary can be shared.
+        if self._request_headers is None:
+            self._request_headers = {
+                "Authorization": f"token {self.module.params['access_token']}",
+                "Content-Type": "application/json",
+            }
 
         # --- Step 3: Execute the API Request ---
 
@@ -270,7 +275,7 @@ class BaseRunner:
             self.module,
             url,
             data=data,
-            headers=headers,
+            headers=self._request_headers,
             method=method,
             timeout=30,  # A sensible default timeout to prevent hung tasks.
         )
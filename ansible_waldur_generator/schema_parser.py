@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 from typing import Dict, Any, Optional, List
 from copy import deepcopy
 
@@ -8,6 +9,32 @@ from ansible_waldur_generator.helpers import (
 )
 
 
+def _fast_copy(obj: Any) -> Any:
+    """
+    Copies a JSON-shaped tree (dicts, lists and immutable scalars).
+
+    OpenAPI specs loaded from YAML/JSON contain nothing else, so recursing only
+    into dicts and lists is equivalent to `deepcopy` here, but much cheaper as it
+    skips the generic memo/`__reduce__` machinery.
+    """
+    obj_type = type(obj)
+    if obj_type is dict:
+        return {key: _fast_copy(value) for key, value in obj.items()}
+    if obj_type is list:
+        return [_fast_copy(value) for value in obj]
+    return obj
+
+
+@lru_cache(maxsize=128)
+def _sample_resource_name(resource_type: Optional[str]) -> str:
+    """
+    Builds the sample 'name' value for a resource type. The resource type is
+    constant for a whole traversal, so the result is computed only once per type.
+    The cache is bounded, as it lives as long as the generator process.
+    """
+    return f"My-Awesome-{(resource_type or 'Resource').replace(' ', '-')}"
+
+
 class ReturnBlockGenerator:
     """
     A comprehensive schema processor for generating Ansible documentation blocks
@@ -37,7 +64,7 @@ class ReturnBlockGenerator:
                 schema = schema[part]
             # Return a deep copy to prevent any modifications to the original spec
             # during processing.
-            return deepcopy(schema)
+            return _fast_copy(schema)
         except (KeyError, IndexError):
             # The reference path was invalid.
             return None
@@ -134,7 +161,7 @@ class ReturnBlockGenerator:
             return "Internal Research Project"
         if prop_name == "name":
             # Generate a descriptive name based on the resource type.
-            return f"My-Awesome-{(resource_type or 'Resource').replace(' ', '-')}"
+            return _sample_resource_name(resource_type)
         if "hostname" in prop_name:
             return "server-01.example.com"
         if prop_name == "key":
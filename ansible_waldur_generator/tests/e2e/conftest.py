@@ -1,58 +1,160 @@
 import os
 import json
 
+from types import MappingProxyType
 from unittest.mock import patch, MagicMock
 
 import pytest
 
 
-def run_module_harness(ansible_module, module_params):
+def _build_mock_module(results):
     """
-    A generic test harness for running any generated Ansible module.
+    Builds the mocked AnsibleModule instance used by the harness.
 
     Args:
-        ansible_module: The imported module object (e.g., volume_module).
-        module_params (dict): A dictionary of parameters to simulate user input.
+        results (dict): A dictionary updated with the arguments passed to
+            exit_json and fail_json.
 
     Returns:
-        A tuple containing the results from exit_json and fail_json.
+        The configured MagicMock instance.
+    """
+    mock_module_instance = MagicMock()
+    mock_module_instance.check_mode = False
+    mock_module_instance.exit_json.side_effect = lambda **kwargs: results.update(
+        exit_json=kwargs
+    )
+    mock_module_instance.fail_json.side_effect = lambda **kwargs: results.update(
+        fail_json=kwargs
+    )
+    # Add jsonify, as it's called by the runner to prepare request bodies
+    mock_module_instance.jsonify = json.dumps
+    return mock_module_instance
+
+
+class ModuleHarness:
+    """
+    A generic test harness for running any generated Ansible module.
+
+    AnsibleModule is patched once per generated module and the mocked instance
+    is reused across runs, so a test module pays the patching cost only once.
+    The mock is reset before every run, so no state leaks between tests.
     """
-    results = {"exit_json": None, "fail_json": None}
 
-    # Patch AnsibleModule within the specific module's namespace
-    with patch.object(ansible_module, "AnsibleModule") as mock_ansible_module_class:
-        mock_module_instance = MagicMock()
+    def __init__(self):
+        self.results = {"exit_json": None, "fail_json": None}
+        self._patchers = {}
+        self._mock_modules = {}
+
+    def _get_mock_module(self, ansible_module):
+        if ansible_module not in self._mock_modules:
+            patcher = patch.object(ansible_module, "AnsibleModule")
+            mock_ansible_module_class = patcher.start()
+            mock_ansible_module_class.return_value = _build_mock_module(self.results)
+            self._patchers[ansible_module] = patcher
+            self._mock_modules[ansible_module] = mock_ansible_module_class.return_value
+        return self._mock_modules[ansible_module]
+
+    def __call__(self, ansible_module, module_params):
+        """
+        Runs the module with the given parameters.
+
+        Returns:
+            A tuple containing the results from exit_json and fail_json.
+        """
+        mock_module_instance = self._get_mock_module(ansible_module)
+        mock_module_instance.reset_mock()
         mock_module_instance.params = module_params
-        mock_module_instance.check_mode = False
-        mock_module_instance.exit_json.side_effect = lambda **kwargs: results.update(
-            exit_json=kwargs
-        )
-        mock_module_instance.fail_json.side_effect = lambda **kwargs: results.update(
-            fail_json=kwargs
-        )
-        # Add jsonify, as it's called by the runner to prepare request bodies
-        mock_module_instance.jsonify = json.dumps
-
-        mock_ansible_module_class.return_value = mock_module_instance
-
-        # Call the main function of the provided module
+        self.results.update(exit_json=None, fail_json=None)
+
         ansible_module.main()
 
-    return results["exit_json"], results["fail_json"]
+        return self.results["exit_json"], self.results["fail_json"]
+
+    def close(self):
+        """Undoes all patches applied by the harness."""
+        for patcher in self._patchers.values():
+            patcher.stop()
+        self._patchers.clear()
+        self._mock_modules.clear()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def harness():
+    """Provides a `ModuleHarness` shared by all tests of a test module."""
+    module_harness = ModuleHarness()
+    yield module_harness
+    module_harness.close()
+
+
+@pytest.fixture(scope="session")
 def auth_params():
-    """Provides a dictionary with standard authentication and API URL parameters."""
-    return {
-        "access_token": os.environ.get("WALDUR_ACCESS_TOKEN", "dummy-token-for-replay"),
-        "api_url": os.environ.get("WALDUR_API_URL", "http://127.0.0.1:8000/"),
+    """
+    Provides the standard authentication and API URL parameters.
+
+    The values only depend on the environment, so they are built once per
+    session and exposed read-only to keep tests from altering them.
+    """
+    return MappingProxyType(
+        {
+            "access_token": os.environ.get(
+                "WALDUR_ACCESS_TOKEN", "dummy-token-for-replay"
+            ),
+            "api_url": os.environ.get("WALDUR_API_URL", "http://127.0.0.1:8000/"),
+        }
+    )
+
+
+# Response headers that the generated runners never read (they only use the
+# status, the body and the pagination 'Link' header). They are dropped from
+# recorded responses to keep cassettes small.
+UNUSED_RESPONSE_HEADERS = frozenset(
+    {
+        "allow",
+        "content-language",
+        "date",
+        "server",
+        "set-cookie",
+        "vary",
+        "x-frame-options",
+        "x-request-id",
+    }
+)
+
+
+def strip_unused_response_headers(response):
+    """A VCR `before_record_response` hook removing `UNUSED_RESPONSE_HEADERS`."""
+    response["headers"] = {
+        name: value
+        for name, value in response["headers"].items()
+        if name.lower() not in UNUSED_RESPONSE_HEADERS
     }
+    return response
 
 
 @pytest.fixture(scope="module")
 def vcr_config():
     return {
+        # Replay only by default, so a missing cassette or an unmatched request
+        # fails at once instead of reaching out to a live API. Recording is
+        # enabled explicitly with `--vcr-record=once`.
+        "record_mode": "none",
         # Replace the Authorization request header with "DUMMY" in cassettes
-        "filter_headers": [("authorization", "DUMMY")],
+        # and drop the request headers that requests are not matched on.
+        "filter_headers": [
+            ("authorization", "DUMMY"),
+            "connection",
+            "cookie",
+            "host",
+            "user-agent",
+            "x-csrftoken",
+        ],
+        "filter_query_parameters": ["token"],
+        # Match requests on method, path and query only. The scheme, host and
+        # port always come from the same api_url, so comparing them is wasted
+        # work, and cassettes keep replaying if that URL changes.
+        "match_on": ("method", "path", "query"),
+        "before_record_response": strip_unused_response_headers,
+        # Store compressed response bodies decoded, so replay skips the
+        # decompression and cassettes stay readable.
+        "decode_compressed_response": True,
     }
@@ -1,137 +1,82 @@
+from typing import NamedTuple
+
 import pytest
 
 # Import the module under test with an alias for clarity.
 from ansible_collections.waldur.openstack.plugins.modules import (
     network_rbac_policy as network_rbac_policy_module,
 )
-from ansible_waldur_generator.tests.e2e.conftest import run_module_harness
+
+
+class _NetworkRbacPolicyTestData(NamedTuple):
+    """Test data shared by the tests of `TestNetworkRbacPolicyModule`."""
+
+    tenant: str = "waldur-dev-farm"
+    network: str = "waldur-dev-farm-int-net"
+    target_tenant: str = "91809"
+    policy_type: str = "access_as_shared"
 
 
 @pytest.mark.vcr
 class TestNetworkRbacPolicyModule:
-    """
-    Groups all end-to-end tests for the 'network_rbac_policy' module.
-    These tests follow a logical lifecycle: create -> check idempotency -> delete -> check idempotency.
-    """
+    """Groups all end-to-end tests for the 'network_rbac_policy' module."""
 
-    # Define consistent test data to be used across the lifecycle tests.
-    TEST_DATA = {
-        "tenant": "waldur-dev-farm",
-        "network": "waldur-dev-farm-int-net",
-        "target_tenant": "91809",
-        "policy_type": "access_as_shared",
-    }
+    # Define consistent test data to be used across the lifecycle steps.
+    TEST_DATA = _NetworkRbacPolicyTestData()
 
-    def test_create_policy(self, auth_params):
-        # Verify that a new RBAC policy can be created successfully.
-        # This is the first step in the resource's lifecycle.
+    def test_policy_lifecycle(self, harness, auth_params):
+        """
+        Walk an RBAC policy through its lifecycle:
+        create -> check idempotency -> delete -> check idempotency.
 
+        The steps depend on each other, so they run in order against a single
+        cassette that holds the interactions of the whole workflow.
+        """
         # --- ARRANGE ---
-        # Define the user's desired state for creating the policy.
-        user_params = {
-            "state": "present",
-            "tenant": self.TEST_DATA["tenant"],
-            "network": self.TEST_DATA["network"],
-            "target_tenant": self.TEST_DATA["target_tenant"],
-            "policy_type": self.TEST_DATA["policy_type"],
+        # Parameters identifying the policy, shared by every step.
+        base_params = {
+            "tenant": self.TEST_DATA.tenant,
+            "network": self.TEST_DATA.network,  # Identifies the parent network.
+            # Required for composite key lookup.
+            "target_tenant": self.TEST_DATA.target_tenant,
             "wait": False,
             **auth_params,  # Unpack standard authentication parameters.
         }
+        present_params = {
+            **base_params,
+            "state": "present",
+            "policy_type": self.TEST_DATA.policy_type,
+        }
+        absent_params = {**base_params, "state": "absent"}
 
-        # --- ACT ---
-        # Use the generic harness to run the module with the defined parameters.
-        exit_result, fail_result = run_module_harness(
-            network_rbac_policy_module, user_params
-        )
-
-        # --- ASSERT ---
-        # 1. Ensure the module did not fail unexpectedly.
+        # --- ACT & ASSERT: create ---
+        exit_result, fail_result = harness(network_rbac_policy_module, present_params)
         assert fail_result is None, f"Module failed unexpectedly with: {fail_result}"
-        # 2. Ensure the module exited successfully.
         assert exit_result is not None
-        # 3. Verify that a change occurred, as this is the first creation.
+        # A change occurred, as this is the first creation.
         assert exit_result["changed"] is True
-        # 4. Verify that the returned resource state contains the correct data.
         assert "resource" in exit_result
 
-    def test_create_policy_idempotent(self, auth_params):
-        # Verify that running the 'create' task again with the same parameters
-        # results in no change, proving idempotency.
-        # --- ARRANGE ---
-        # The parameters are identical to the 'create' test.
-        user_params = {
-            "state": "present",
-            "tenant": self.TEST_DATA["tenant"],
-            "network": self.TEST_DATA["network"],
-            "target_tenant": self.TEST_DATA["target_tenant"],
-            "policy_type": self.TEST_DATA["policy_type"],
-            "wait": False,
-            **auth_params,
-        }
-
-        # --- ACT ---
-        exit_result, fail_result = run_module_harness(
-            network_rbac_policy_module, user_params
-        )
-
-        # --- ASSERT ---
+        # --- ACT & ASSERT: create again ---
+        exit_result, fail_result = harness(network_rbac_policy_module, present_params)
         assert fail_result is None
         assert exit_result is not None
-        # 5. The key assertion: no change should be reported.
+        # The policy already exists, so no change should be reported.
         assert exit_result["changed"] is False
 
-    def test_delete_policy(self, auth_params):
-        # Verify that an existing RBAC policy can be deleted.
-        # This tests the complex deletion path with two path parameters.
-        # --- ARRANGE ---
-        # Define the parameters needed to identify and delete the policy.
-        user_params = {
-            "state": "absent",
-            "tenant": self.TEST_DATA["tenant"],
-            "network": self.TEST_DATA["network"],  # Identifies the parent network.
-            "target_tenant": self.TEST_DATA[
-                "target_tenant"
-            ],  # Required for composite key lookup.
-            "wait": False,
-            **auth_params,
-        }
-
-        # --- ACT ---
-        exit_result, fail_result = run_module_harness(
-            network_rbac_policy_module, user_params
-        )
-
-        # --- ASSERT ---
+        # --- ACT & ASSERT: delete ---
+        # This tests the deletion path with two path parameters.
+        exit_result, fail_result = harness(network_rbac_policy_module, absent_params)
         assert fail_result is None
         assert exit_result is not None
-        # 6. Verify that deleting an existing resource reports a change.
+        # Deleting an existing resource reports a change...
         assert exit_result["changed"] is True
-        # 7. A successful deletion should result in a null resource state.
+        # ...and results in a null resource state.
         assert exit_result["resource"] is None
 
-    def test_delete_policy_idempotent(self, auth_params):
-        """
-        Verify that running the 'delete' task again on a non-existent resource
-        results in no change, proving idempotency for the absent state.
-        """
-        # --- ARRANGE ---
-        # The parameters are identical to the 'delete' test.
-        user_params = {
-            "state": "absent",
-            "tenant": self.TEST_DATA["tenant"],
-            "network": self.TEST_DATA["network"],
-            "target_tenant": self.TEST_DATA["target_tenant"],
-            "wait": False,
-            **auth_params,
-        }
-
-        # --- ACT ---
-        exit_result, fail_result = run_module_harness(
-            network_rbac_policy_module, user_params
-        )
-
-        # --- ASSERT ---
+        # --- ACT & ASSERT: delete again ---
+        exit_result, fail_result = harness(network_rbac_policy_module, absent_params)
         assert fail_result is None
         assert exit_result is not None
-        # 8. The key assertion: no change should be reported as the resource is already gone.
+        # The resource is already gone, so no change should be reported.
         assert exit_result["changed"] is False
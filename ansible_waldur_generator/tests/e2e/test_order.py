@@ -1,27 +1,32 @@
+from typing import NamedTuple
+
 import pytest
 from ansible_collections.waldur.marketplace.plugins.modules import (
     order as order_module,
 )
-from ansible_waldur_generator.tests.e2e.conftest import run_module_harness
+
+
+class _OrderTestData(NamedTuple):
+    """Test data shared by the tests of `TestOrderModule`."""
+
+    project: str = "d75"
+    offering: str = "fcf6fac7221f49c8b6a33011f5bfc1b6"
+    resource_name: str = "E2E Test Order Resource"
 
 
 @pytest.mark.vcr
 class TestOrderModule:
     """End-to-end tests for the marketplace order module using VCR."""
 
-    TEST_DATA = {
-        "project": "d75",
-        "offering": "fcf6fac7221f49c8b6a33011f5bfc1b6",
-        "resource_name": "E2E Test Order Resource",
-    }
+    TEST_DATA = _OrderTestData()
 
-    def test_create_order_basic(self, auth_params):
+    def test_create_order_basic(self, harness, auth_params):
         """Test creating a basic marketplace order for a new resource."""
         user_params = {
             "state": "present",
-            "name": self.TEST_DATA["resource_name"],
-            "project": self.TEST_DATA["project"],
-            "offering": self.TEST_DATA["offering"],
+            "name": self.TEST_DATA.resource_name,
+            "project": self.TEST_DATA.project,
+            "offering": self.TEST_DATA.offering,
             "limits": {},
             "attributes": {"permissions": "775", "storage_data_type": "Store"},
             "accepting_terms_of_service": True,
@@ -30,7 +35,7 @@ class TestOrderModule:
             **auth_params,
         }
 
-        exit_result, fail_result = run_module_harness(order_module, user_params)
+        exit_result, fail_result = harness(order_module, user_params)
 
         # ASSERT
         assert fail_result is None, f"Module failed unexpectedly with: {fail_result}"
@@ -1,26 +1,36 @@
+from types import MappingProxyType
+
 import pytest
 
 from ansible_collections.waldur.openstack.plugins.modules import (
     security_group as security_group_module,
     security_group_facts as security_group_facts_module,
 )
-from ansible_waldur_generator.tests.e2e.conftest import run_module_harness
 
 
 @pytest.mark.vcr
 class TestSecurityGroupModule:
-    def test_create_security_group_with_rules(self, auth_params):
+    # Parameters identifying the security group created and updated by the
+    # tests. Read-only, so tests can safely build on it.
+    SECURITY_GROUP_PARAMS = MappingProxyType(
+        {
+            "state": "present",
+            "name": "E2E-VCR-Test-SG",
+            "description": "Security group created by an end-to-end VCR test.",
+            # The parent resource under which the security group will be created.
+            "tenant": "os-tenant-agnes-ku-12-antelope-1",
+            "wait": False,
+        }
+    )
+
+    def test_create_security_group_with_rules(self, harness, auth_params):
         """
         End-to-end test for creating a new OpenStack security group with a set of rules.
         """
         # --- ARRANGE ---
         # Define the user's desired state for the security group in the playbook.
         user_params = {
-            "state": "present",
-            "name": "E2E-VCR-Test-SG",
-            "description": "Security group created by an end-to-end VCR test.",
-            # The parent resource under which the security group will be created.
-            "tenant": "os-tenant-agnes-ku-12-antelope-1",
+            **self.SECURITY_GROUP_PARAMS,
             # A list of security group rules to be applied.
             "rules": [
                 {
@@ -38,15 +48,12 @@ class TestSecurityGroupModule:
                     "description": "Allow HTTPS from anywhere.",
                 },
             ],
-            "wait": False,  # Ensure we wait for the resource to become active.
             **auth_params,  # Unpack standard authentication parameters.
         }
 
         # --- ACT ---
         # Use the generic harness to run the module with the defined parameters.
-        exit_result, fail_result = run_module_harness(
-            security_group_module, user_params
-        )
+        exit_result, fail_result = harness(security_group_module, user_params)
 
         # --- ASSERT ---
         # 1. Ensure the module did not fail unexpectedly.
@@ -58,7 +65,7 @@ class TestSecurityGroupModule:
         # 3. Verify that a change occurred.
         assert exit_result["changed"] is True
 
-    def test_create_security_group_with_remote_group(self, auth_params):
+    def test_create_security_group_with_remote_group(self, harness, auth_params):
         # --- ARRANGE ---
         user_params = {
             "state": "present",
@@ -82,9 +89,7 @@ class TestSecurityGroupModule:
 
         # --- ACT ---
         # Use the generic harness to run the module with the defined parameters.
-        exit_result, fail_result = run_module_harness(
-            security_group_module, user_params
-        )
+        exit_result, fail_result = harness(security_group_module, user_params)
 
         # --- ASSERT ---
         # 1. Ensure the module did not fail unexpectedly.
@@ -96,60 +101,24 @@ class TestSecurityGroupModule:
         # 3. Verify that a change occurred.
         assert exit_result["changed"] is True
 
-    def test_update_rules(self, auth_params):
+    @pytest.mark.parametrize(
+        "expected_changed",
+        [
+            pytest.param(True, id="performed"),
+            pytest.param(False, id="not_needed"),
+        ],
+    )
+    def test_update_rules(self, harness, auth_params, expected_changed):
         """
         End-to-end test for updating an existing OpenStack security group with a set of rules.
-        """
-        # --- ARRANGE ---
-        # Define the user's desired state for the security group in the playbook.
-        user_params = {
-            "state": "present",
-            "name": "E2E-VCR-Test-SG",
-            "description": "Security group created by an end-to-end VCR test.",
-            # The parent resource under which the security group will be created.
-            "tenant": "os-tenant-agnes-ku-12-antelope-1",
-            # A list of security group rules to be applied.
-            "rules": [
-                {
-                    "protocol": "tcp",
-                    "from_port": 443,
-                    "to_port": 443,
-                    "cidr": "0.0.0.0/0",
-                    "description": "Allow HTTPS from anywhere.",
-                },
-            ],
-            "wait": False,  # Ensure we wait for the resource to become active.
-            **auth_params,  # Unpack standard authentication parameters.
-        }
-
-        # --- ACT ---
-        # Use the generic harness to run the module with the defined parameters.
-        exit_result, fail_result = run_module_harness(
-            security_group_module, user_params
-        )
-
-        # --- ASSERT ---
-        # 1. Ensure the module did not fail unexpectedly.
-        assert fail_result is None, f"Module failed unexpectedly with: {fail_result}"
-
-        # 2. Ensure the module exited successfully.
-        assert exit_result is not None
-
-        # 3. Verify that a change occurred.
-        assert exit_result["changed"] is True
 
-    def test_update_rules_not_needed(self, auth_params):
-        """
-        End-to-end test for updating an existing OpenStack security group with a set of rules.
+        The same desired state is applied against two recorded API states: one
+        where the rules differ and must be updated, and one where they already match.
         """
         # --- ARRANGE ---
         # Define the user's desired state for the security group in the playbook.
         user_params = {
-            "state": "present",
-            "name": "E2E-VCR-Test-SG",
-            "description": "Security group created by an end-to-end VCR test.",
-            # The parent resource under which the security group will be created.
-            "tenant": "os-tenant-agnes-ku-12-antelope-1",
+            **self.SECURITY_GROUP_PARAMS,
             # A list of security group rules to be applied.
             "rules": [
                 {
@@ -160,15 +129,12 @@ class TestSecurityGroupModule:
                     "description": "Allow HTTPS from anywhere.",
                 },
             ],
-            "wait": False,  # Ensure we wait for the resource to become active.
             **auth_params,  # Unpack standard authentication parameters.
         }
 
         # --- ACT ---
         # Use the generic harness to run the module with the defined parameters.
-        exit_result, fail_result = run_module_harness(
-            security_group_module, user_params
-        )
+        exit_result, fail_result = harness(security_group_module, user_params)
 
         # --- ASSERT ---
         # 1. Ensure the module did not fail unexpectedly.
@@ -177,10 +143,10 @@ class TestSecurityGroupModule:
         # 2. Ensure the module exited successfully.
         assert exit_result is not None
 
-        # 3. Verify that a change occurred.
-        assert exit_result["changed"] is False
+        # 3. Verify whether a change occurred.
+        assert exit_result["changed"] is expected_changed
 
-    def test_fetch_security_group(self, auth_params):
+    def test_fetch_security_group(self, harness, auth_params):
         # --- ARRANGE ---
         user_params = {
             "name": "E2E-VCR-Test-SG",
@@ -190,9 +156,7 @@ class TestSecurityGroupModule:
 
         # --- ACT ---
         # Use the generic harness to run the module with the defined parameters.
-        exit_result, fail_result = run_module_harness(
-            security_group_facts_module, user_params
-        )
+        exit_result, fail_result = harness(security_group_facts_module, user_params)
 
         # --- ASSERT ---
         # 1. Ensure the module did not fail unexpectedly.
@@ -207,7 +171,7 @@ class TestSecurityGroupModule:
         assert len(exit_result["resources"]) == 1
         assert exit_result["resources"][0]["name"] == "E2E-VCR-Test-SG"
 
-    def test_fetch_all_security_groups_paginated(self, auth_params):
+    def test_fetch_all_security_groups_paginated(self, harness, auth_params):
         """
         Regression test for the pagination bug: when more security groups exist
         than fit on a single API page (Waldur's default page size is 10), the
@@ -222,9 +186,7 @@ class TestSecurityGroupModule:
         user_params = {**auth_params}
 
         # --- ACT ---
-        exit_result, fail_result = run_module_harness(
-            security_group_facts_module, user_params
-        )
+        exit_result, fail_result = harness(security_group_facts_module, user_params)
 
         # --- ASSERT ---
         assert fail_result is None, f"Module failed unexpectedly with: {fail_result}"
@@ -1,10 +1,11 @@
+from types import MappingProxyType
+
 import pytest
 
 # Import the module under test with a clear alias
 from ansible_collections.waldur.openstack.plugins.modules import (
     subnet as subnet_module,
 )
-from ansible_waldur_generator.tests.e2e.conftest import run_module_harness
 
 
 @pytest.mark.vcr
@@ -22,22 +23,30 @@ class TestSubnetModule:
         "cidr": "20.0.20.0/24",
     }
 
-    def test_create_subnet_fails(self, auth_params):
+    # Parameters identifying the test subnet, shared by the lifecycle tests.
+    # Read-only, so tests can safely build on it.
+    SUBNET_PARAMS = MappingProxyType(
+        {
+            "name": TEST_DATA["subnet_name"],
+            "network": TEST_DATA["network"],
+            "tenant": TEST_DATA["tenant"],
+            "wait": False,
+        }
+    )
+
+    def test_create_subnet_fails(self, harness, auth_params):
         # --- ARRANGE ---
         # Define the user's desired state for creating the subnet.
         user_params = {
+            **self.SUBNET_PARAMS,
             "state": "present",
-            "name": self.TEST_DATA["subnet_name"],
-            "network": self.TEST_DATA["network"],
-            "tenant": self.TEST_DATA["tenant"],
             "cidr": self.TEST_DATA["cidr"],
             "description": "Subnet created by an end-to-end VCR test.",
-            "wait": False,
             **auth_params,
         }
 
         # --- ACT ---
-        exit_result, fail_result = run_module_harness(subnet_module, user_params)
+        exit_result, fail_result = harness(subnet_module, user_params)
 
         # --- ASSERT ---
         assert (
@@ -45,7 +54,7 @@ class TestSubnetModule:
             == "Internal network cannot have more than one subnet."
         )
 
-    def test_create_subnet_exists(self, auth_params):
+    def test_create_subnet_exists(self, harness, auth_params):
         """
         Verify that running the 'create' task again with the same parameters
         results in no change, proving idempotency.
@@ -53,25 +62,22 @@ class TestSubnetModule:
         # --- ARRANGE ---
         # Define the user's desired state for creating the subnet.
         user_params = {
+            **self.SUBNET_PARAMS,
             "state": "present",
-            "name": self.TEST_DATA["subnet_name"],
-            "network": self.TEST_DATA["network"],
-            "tenant": self.TEST_DATA["tenant"],
             "cidr": self.TEST_DATA["cidr"],
             "description": "Subnet created by an end-to-end VCR test.",
-            "wait": False,
             **auth_params,
         }
 
         # --- ACT ---
-        exit_result, fail_result = run_module_harness(subnet_module, user_params)
+        exit_result, fail_result = harness(subnet_module, user_params)
 
         # --- ASSERT ---
         assert fail_result is None, f"Module failed unexpectedly with: {fail_result}"
         assert exit_result is not None
         assert exit_result["changed"] is False
 
-    def test_create_subnet_succeeds(self, auth_params):
+    def test_create_subnet_succeeds(self, harness, auth_params):
         """
         Verify that a new subnet can be created successfully under a parent network.
         This is the first step in the resource's lifecycle.
@@ -79,18 +85,15 @@ class TestSubnetModule:
         # --- ARRANGE ---
         # Define the user's desired state for creating the subnet.
         user_params = {
+            **self.SUBNET_PARAMS,
             "state": "present",
-            "name": self.TEST_DATA["subnet_name"],
-            "network": self.TEST_DATA["network"],
-            "tenant": self.TEST_DATA["tenant"],
             "cidr": self.TEST_DATA["cidr"],
             "description": "Subnet created by an end-to-end VCR test.",
-            "wait": False,
             **auth_params,
         }
 
         # --- ACT ---
-        exit_result, fail_result = run_module_harness(subnet_module, user_params)
+        exit_result, fail_result = harness(subnet_module, user_params)
 
         # --- ASSERT ---
         assert fail_result is None, f"Module failed unexpectedly with: {fail_result}"
@@ -100,24 +103,21 @@ class TestSubnetModule:
         assert exit_result["resource"]["name"] == self.TEST_DATA["subnet_name"]
         assert exit_result["resource"]["cidr"] == self.TEST_DATA["cidr"]
 
-    def test_update_subnet(self, auth_params):
+    def test_update_subnet(self, harness, auth_params):
         """
         Verify that an existing subnet's description can be updated.
         """
         # --- ARRANGE ---
         new_description = "Updated description for VCR test."
         user_params = {
+            **self.SUBNET_PARAMS,
             "state": "present",
-            "name": self.TEST_DATA["subnet_name"],
-            "network": self.TEST_DATA["network"],
-            "tenant": self.TEST_DATA["tenant"],
             "description": new_description,
-            "wait": False,
             **auth_params,
         }
 
         # --- ACT ---
-        exit_result, fail_result = run_module_harness(subnet_module, user_params)
+        exit_result, fail_result = harness(subnet_module, user_params)
 
         # --- ASSERT ---
         assert fail_result is None
@@ -125,46 +125,41 @@ class TestSubnetModule:
         assert exit_result["changed"] is True
         assert exit_result["resource"]["description"] == new_description
 
-    def test_update_subnet_idempotent(self, auth_params):
+    def test_update_subnet_idempotent(self, harness, auth_params):
         """
         Verify that running the 'update' task again with the same new description
         results in no change.
         """
         # --- ARRANGE ---
         user_params = {
+            **self.SUBNET_PARAMS,
             "state": "present",
             "name": "waldur-dev-farm-sub-net",
-            "network": self.TEST_DATA["network"],
-            "tenant": self.TEST_DATA["tenant"],
             "description": "Updated description for VCR test.",
-            "wait": False,
             **auth_params,
         }
 
         # --- ACT ---
-        exit_result, fail_result = run_module_harness(subnet_module, user_params)
+        exit_result, fail_result = harness(subnet_module, user_params)
 
         # --- ASSERT ---
         assert fail_result is None
         assert exit_result is not None
         assert exit_result["changed"] is False
 
-    def test_delete_subnet(self, auth_params):
+    def test_delete_subnet(self, harness, auth_params):
         """
         Verify that an existing subnet can be deleted.
         """
         # --- ARRANGE ---
         user_params = {
+            **self.SUBNET_PARAMS,
             "state": "absent",
-            "name": self.TEST_DATA["subnet_name"],
-            "network": self.TEST_DATA["network"],
-            "tenant": self.TEST_DATA["tenant"],
-            "wait": False,
             **auth_params,
         }
 
         # --- ACT ---
-        exit_result, fail_result = run_module_harness(subnet_module, user_params)
+        exit_result, fail_result = harness(subnet_module, user_params)
 
         # --- ASSERT ---
         assert fail_result is None
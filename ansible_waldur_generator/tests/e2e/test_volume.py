@@ -3,7 +3,6 @@ import pytest
 from ansible_collections.waldur.openstack.plugins.modules import (
     volume as volume_module,
 )
-from ansible_waldur_generator.tests.e2e.conftest import run_module_harness
 
 
 @pytest.mark.vcr
@@ -17,7 +16,7 @@ class TestVolumeModule:
         "volume_name": "E2E Test Volume via VCR",
     }
 
-    def test_create_volume(self, auth_params):
+    def test_create_volume(self, harness, auth_params):
         """End-to-end test for creating a new volume."""
         user_params = {
             "state": "present",
@@ -29,7 +28,7 @@ class TestVolumeModule:
             **auth_params,
         }
 
-        exit_result, fail_result = run_module_harness(volume_module, user_params)
+        exit_result, fail_result = harness(volume_module, user_params)
 
         # ASSERT
         assert fail_result is None, f"Module failed unexpectedly with: {fail_result}"
@@ -43,7 +42,7 @@ class TestVolumeModule:
             exit_result["commands"][0]["body"]["attributes"]["size"] == 20480
         )  # 20 GiB in MiB
 
-    def test_extend_volume(self, auth_params):
+    def test_extend_volume(self, harness, auth_params):
         """Test extending an existing volume using the 'size' parameter, which maps to 'disk_size'."""
         user_params = {
             "state": "present",
@@ -55,7 +54,7 @@ class TestVolumeModule:
             **auth_params,
         }
 
-        exit_result, fail_result = run_module_harness(volume_module, user_params)
+        exit_result, fail_result = harness(volume_module, user_params)
 
         # ASSERT
         assert fail_result is None
@@ -67,7 +66,7 @@ class TestVolumeModule:
         assert "/extend/" in command["url"]
         assert command["body"] == {"disk_size": 30720}
 
-    def test_retype_volume(self, auth_params):
+    def test_retype_volume(self, harness, auth_params):
         """Test retyping an existing volume."""
         user_params = {
             "state": "present",
@@ -79,7 +78,7 @@ class TestVolumeModule:
             **auth_params,
         }
 
-        exit_result, fail_result = run_module_harness(volume_module, user_params)
+        exit_result, fail_result = harness(volume_module, user_params)
 
         # ASSERT
         assert fail_result is None
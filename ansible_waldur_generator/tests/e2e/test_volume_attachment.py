@@ -3,7 +3,6 @@ import pytest
 from ansible_collections.waldur.openstack.plugins.modules import (
     volume_attachment as volume_attachment_module,
 )
-from ansible_waldur_generator.tests.e2e.conftest import run_module_harness
 
 
 @pytest.mark.vcr
@@ -21,7 +20,7 @@ class TestVolumeAttachmentModule:
         "tenant": "Thesis Analyzer VM",
     }
 
-    def test_attach_volume(self, auth_params):
+    def test_attach_volume(self, harness, auth_params):
         """
         Verify that a volume can be successfully attached to an instance.
         """
@@ -39,9 +38,7 @@ class TestVolumeAttachmentModule:
 
         # --- ACT ---
         # Use the generic harness to run the module with the defined parameters.
-        exit_result, fail_result = run_module_harness(
-            volume_attachment_module, user_params
-        )
+        exit_result, fail_result = harness(volume_attachment_module, user_params)
 
         # --- ASSERT ---
         # 1. Ensure the module did not fail unexpectedly.
@@ -53,7 +50,7 @@ class TestVolumeAttachmentModule:
         # 4. Verify that the returned resource (the volume) now shows it is attached to an instance.
         assert "resource" in exit_result
 
-    def test_detach_volume(self, auth_params):
+    def test_detach_volume(self, harness, auth_params):
         """
         Verify that a volume can be successfully detached from an instance.
         """
@@ -71,9 +68,7 @@ class TestVolumeAttachmentModule:
 
         # --- ACT ---
         # Use the generic harness to run the module with the defined parameters.
-        exit_result, fail_result = run_module_harness(
-            volume_attachment_module, user_params
-        )
+        exit_result, fail_result = harness(volume_attachment_module, user_params)
 
         # --- ASSERT ---
         # 1. Ensure the module did not fail unexpectedly.
@@ -4,7 +4,6 @@ import pytest
 from ansible_collections.waldur.openstack.plugins.modules import (
     vpc_action as vpc_action_module,
 )
-from ansible_waldur_generator.tests.e2e.conftest import run_module_harness
 
 
 @pytest.mark.vcr
@@ -20,7 +19,7 @@ class TestVpcActionModule:
         "project": "Self-Service dev infrastructure",
     }
 
-    def test_pull_vpc(self, auth_params):
+    def test_pull_vpc(self, harness, auth_params):
         """
         Verify that the 'pull' action can be successfully executed on an
         existing OpenStack tenant (VPC).
@@ -40,7 +39,7 @@ class TestVpcActionModule:
 
         # --- ACT ---
         # Use the generic harness to run the module with the defined parameters.
-        exit_result, fail_result = run_module_harness(vpc_action_module, user_params)
+        exit_result, fail_result = harness(vpc_action_module, user_params)
 
         # --- ASSERT ---
         # 1. Ensure the module did not fail unexpectedly.
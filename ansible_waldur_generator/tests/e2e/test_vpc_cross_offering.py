@@ -2,7 +2,6 @@ import pytest
 from ansible_collections.waldur.openstack.plugins.modules import (
     vpc as vpc_module,
 )
-from ansible_waldur_generator.tests.e2e.conftest import run_module_harness
 
 
 @pytest.mark.vcr
@@ -22,7 +21,7 @@ class TestVPCCrossOffering:
         "resource_name": "test-vpc",
     }
 
-    def test_create_vpc_same_name_different_offerings(self, auth_params):
+    def test_create_vpc_same_name_different_offerings(self, harness, auth_params):
         """
         Scenario:
         1. Create VPC 'test-vpc' in Offering 1.
@@ -44,7 +43,7 @@ class TestVPCCrossOffering:
             **auth_params,
         }
 
-        exit_1, fail_1 = run_module_harness(vpc_module, params_1)
+        exit_1, fail_1 = harness(vpc_module, params_1)
         assert fail_1 is None, f"Step 1 failed: {fail_1}"
 
         # --- Step 2: Create in Offering 2 ---
@@ -59,5 +58,5 @@ class TestVPCCrossOffering:
             **auth_params,
         }
 
-        exit_2, fail_2 = run_module_harness(vpc_module, params_2)
+        exit_2, fail_2 = harness(vpc_module, params_2)
         assert fail_2 is None, f"Step 2 failed: {fail_2}"
@@ -1,17 +1,39 @@
 """Tests for the ApiSpecParser class."""
 
+from types import MappingProxyType
+
 import pytest
 from ansible_waldur_generator.api_parser import ApiSpecParser
 from ansible_waldur_generator.helpers import ValidationErrorCollector
 
+# The `{uuid}` path parameter shared by the detail endpoints of the sample spec.
+UUID_PATH_PARAM = {
+    "name": "uuid",
+    "in": "path",
+    "required": True,
+    "schema": {"type": "string", "format": "uuid"},
+}
+
+
+def _freeze(value):
+    """Returns a read-only view of a JSON-like value, with lists turned into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
 
 class TestApiSpecParser:
     """Test suite for the ApiSpecParser class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_api_spec(self):
-        """Realistic OpenAPI specification based on actual Waldur API."""
-        return {
+        """
+        Realistic OpenAPI specification based on actual Waldur API. It is shared
+        by the whole module, so it is frozen to make any mutation fail loudly.
+        """
+        spec = {
             "openapi": "3.0.3",
             "info": {"title": "Waldur API", "version": "0.0.0"},
             "paths": {
@@ -105,14 +127,7 @@ class TestApiSpecParser:
                 "/api/customers/{uuid}/": {
                     "get": {
                         "operationId": "customers_retrieve",
-                        "parameters": [
-                            {
-                                "name": "uuid",
-                                "in": "path",
-                                "required": True,
-                                "schema": {"type": "string", "format": "uuid"},
-                            }
-                        ],
+                        "parameters": [UUID_PATH_PARAM],
                         "tags": ["customers"],
                         "responses": {
                             "200": {
@@ -129,14 +144,7 @@ class TestApiSpecParser:
                     },
                     "patch": {
                         "operationId": "customers_partial_update",
-                        "parameters": [
-                            {
-                                "name": "uuid",
-                                "in": "path",
-                                "required": True,
-                                "schema": {"type": "string", "format": "uuid"},
-                            }
-                        ],
+                        "parameters": [UUID_PATH_PARAM],
                         "tags": ["customers"],
                         "requestBody": {
                             "content": {
@@ -162,14 +170,7 @@ class TestApiSpecParser:
                     },
                     "delete": {
                         "operationId": "customers_destroy",
-                        "parameters": [
-                            {
-                                "name": "uuid",
-                                "in": "path",
-                                "required": True,
-                                "schema": {"type": "string", "format": "uuid"},
-                            }
-                        ],
+                        "parameters": [UUID_PATH_PARAM],
                         "tags": ["customers"],
                         "responses": {"204": {"description": "No response body"}},
                     },
@@ -243,14 +244,7 @@ class TestApiSpecParser:
                 "/api/projects/{uuid}/": {
                     "get": {
                         "operationId": "projects_retrieve",
-                        "parameters": [
-                            {
-                                "name": "uuid",
-                                "in": "path",
-                                "required": True,
-                                "schema": {"type": "string", "format": "uuid"},
-                            }
-                        ],
+                        "parameters": [UUID_PATH_PARAM],
                         "tags": ["projects"],
                         "responses": {
                             "200": {
@@ -267,14 +261,7 @@ class TestApiSpecParser:
                     },
                     "patch": {
                         "operationId": "projects_partial_update",
-                        "parameters": [
-                            {
-                                "name": "uuid",
-                                "in": "path",
-                                "required": True,
-                                "schema": {"type": "string", "format": "uuid"},
-                            }
-                        ],
+                        "parameters": [UUID_PATH_PARAM],
                         "tags": ["projects"],
                         "requestBody": {
                             "content": {
@@ -301,14 +288,7 @@ class TestApiSpecParser:
                     "delete": {
                         "operationId": "projects_destroy",
                         "description": "If a project has connected instances, deletion request will fail with 409 response code.",
-                        "parameters": [
-                            {
-                                "name": "uuid",
-                                "in": "path",
-                                "required": True,
-                                "schema": {"type": "string", "format": "uuid"},
-                            }
-                        ],
+                        "parameters": [UUID_PATH_PARAM],
                         "tags": ["projects"],
                         "responses": {"204": {"description": "No response body"}},
                     },
@@ -432,10 +412,11 @@ class TestApiSpecParser:
                 }
             },
         }
+        return _freeze(spec)
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def parser(self, sample_api_spec):
-        """Create an ApiSpecParser instance."""
+        """Create an ApiSpecParser instance, shared since parsing is read-only."""
         collector = ValidationErrorCollector()
         return ApiSpecParser(sample_api_spec, collector)
 
@@ -446,28 +427,31 @@ class TestApiSpecParser:
         assert parser.api_spec == sample_api_spec
         assert parser.collector == collector
 
-    def test_get_operation(self, parser):
+    @pytest.mark.parametrize(
+        "operation_id, path, method, has_body",
+        [
+            ("customers_list", "/api/customers/", "GET", False),
+            ("customers_create", "/api/customers/", "POST", True),
+            ("projects_list", "/api/projects/", "GET", False),
+        ],
+    )
+    def test_get_operation(self, parser, operation_id, path, method, has_body):
         """Test getting operations by operation ID."""
-        # Test customers operations
-        customers_list = parser.get_operation("customers_list")
-        assert customers_list is not None
-        assert customers_list.path == "/api/customers/"
-        assert customers_list.method == "GET"
-        assert customers_list.operation_id == "customers_list"
-
-        customers_create = parser.get_operation("customers_create")
-        assert customers_create is not None
-        assert customers_create.path == "/api/customers/"
-        assert customers_create.method == "POST"
-        assert customers_create.operation_id == "customers_create"
-        assert customers_create.model_schema is not None
-
-        # Test projects operations
-        projects_list = parser.get_operation("projects_list")
-        assert projects_list is not None
-        assert projects_list.path == "/api/projects/"
-        assert projects_list.method == "GET"
-        assert projects_list.operation_id == "projects_list"
+        operation = parser.get_operation(operation_id)
+
+        assert operation is not None
+        assert operation.path == path
+        assert operation.method == method
+        assert operation.operation_id == operation_id
+        if has_body:
+            assert operation.model_schema["type"] == "object"
+        else:
+            assert operation.model_schema is None
+
+    def test_get_operation_nonexistent(self, parser):
+        """Test getting non-existent operation."""
+        operation = parser.get_operation("nonexistent_operation")
+        assert operation is None
 
     def test_get_schema_by_ref(self, parser):
         """Test reference resolution."""
@@ -489,12 +473,9 @@ class TestApiSpecParser:
         """Test extracting query parameters for operation."""
         params = parser.get_query_parameters_for_operation("customers_list")
 
+        expected = {"name", "name_exact", "abbreviation", "archived", "backend_id"}
         assert isinstance(params, dict)
-        assert "name" in params
-        assert "name_exact" in params
-        assert "abbreviation" in params
-        assert "archived" in params
-        assert "backend_id" in params
+        assert expected <= params.keys()
 
     def test_get_query_parameters_for_operation_no_params(self, parser):
         """Test operation without query parameters."""
@@ -503,27 +484,6 @@ class TestApiSpecParser:
         assert isinstance(params, dict)
         assert len(params) == 0
 
-    def test_get_operation_nonexistent(self, parser):
-        """Test getting non-existent operation."""
-        operation = parser.get_operation("nonexistent_operation")
-        assert operation is None
-
-    def test_operation_with_request_body(self, parser):
-        """Test operation with request body schema."""
-        operation = parser.get_operation("customers_create")
-
-        assert operation is not None
-        assert operation.model_schema is not None
-        assert "type" in operation.model_schema
-        assert operation.model_schema["type"] == "object"
-
-    def test_operation_without_request_body(self, parser):
-        """Test operation without request body."""
-        operation = parser.get_operation("customers_list")
-
-        assert operation is not None
-        assert operation.model_schema is None
-
     def test_empty_spec(self):
         """Test handling of empty API specification."""
         empty_spec = {"openapi": "3.0.0", "paths": {}}
@@ -551,8 +511,59 @@ class TestApiSpecParser:
         collector = ValidationErrorCollector()
         parser = ApiSpecParser(spec, collector)
 
-        assert parser.get_operation("resource_get") is not None
-        assert parser.get_operation("resource_post") is not None
-        assert parser.get_operation("resource_put") is not None
-        assert parser.get_operation("resource_patch") is not None
-        assert parser.get_operation("resource_delete") is not None
+        # Collect every lookup first, so a failure reports all missing operations.
+        expected = {
+            f"resource_{method}": method.upper()
+            for method in ("get", "post", "put", "patch", "delete")
+        }
+        found = {
+            operation_id: getattr(parser.get_operation(operation_id), "method", None)
+            for operation_id in expected
+        }
+        assert found == expected
+
+    def test_duplicate_operation_id_uses_first_definition(self):
+        """Test that the first definition of a duplicated operation ID is used."""
+        spec = {
+            "openapi": "3.0.0",
+            "paths": {
+                "/api/first/": {"get": {"operationId": "duplicated"}},
+                "/api/second/": {"get": {"operationId": "duplicated"}},
+            },
+        }
+
+        collector = ValidationErrorCollector()
+        parser = ApiSpecParser(spec, collector)
+
+        assert parser.get_operation("duplicated").path == "/api/first/"
+
+    def test_path_level_fields_are_not_operations(self):
+        """Test that path item fields other than HTTP methods are skipped."""
+        spec = {
+            "openapi": "3.0.0",
+            "paths": {
+                "/api/resource/{uuid}/": {
+                    "summary": "A single resource",
+                    "parameters": [UUID_PATH_PARAM],
+                    "get": {"operationId": "resource_retrieve"},
+                }
+            },
+        }
+
+        collector = ValidationErrorCollector()
+        parser = ApiSpecParser(spec, collector)
+
+        assert parser.get_operation("resource_retrieve").method == "GET"
+
+    def test_operation_without_id_is_not_indexed(self):
+        """Test that operations without an operationId cannot be looked up."""
+        spec = {
+            "openapi": "3.0.0",
+            "paths": {"/api/resource/": {"get": {"summary": "No operation ID"}}},
+        }
+
+        collector = ValidationErrorCollector()
+        parser = ApiSpecParser(spec, collector)
+
+        assert parser.get_operation(None) is None
+        assert parser.get_query_parameters_for_operation(None) == {}
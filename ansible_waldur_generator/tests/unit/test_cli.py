@@ -1,8 +1,6 @@
 """Tests for the CLI module."""
 
 import os
-import tempfile
-import shutil
 from unittest.mock import Mock, patch
 import pytest
 import yaml
@@ -37,9 +35,10 @@ class TestCliConstants:
 class TestCliArgumentParsing:
     """Test CLI argument parsing functionality."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
+    @pytest.fixture(autouse=True)
+    def setup_files(self, tmp_path):
+        """Set up test fixtures in pytest's per-test temporary directory."""
+        self.temp_dir = str(tmp_path)
         self.config_file = os.path.join(self.temp_dir, "config.yaml")
         self.api_spec_file = os.path.join(self.temp_dir, "api_spec.yaml")
         self.output_dir = os.path.join(self.temp_dir, "output")
@@ -54,10 +53,6 @@ class TestCliArgumentParsing:
         with open(self.api_spec_file, "w") as f:
             yaml.dump(test_api_spec, f)
 
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
     @patch("ansible_waldur_generator.cli.Generator")
     @patch("sys.argv", ["generate"])
     def test_main_with_default_arguments(self, mock_generator_class):
@@ -162,9 +157,10 @@ class TestCliArgumentParsing:
 class TestCliIntegration:
     """Test CLI integration with real argument parsing."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
+    @pytest.fixture(autouse=True)
+    def setup_files(self, tmp_path):
+        """Set up test fixtures in pytest's per-test temporary directory."""
+        self.temp_dir = str(tmp_path)
         self.config_file = os.path.join(self.temp_dir, "config.yaml")
         self.api_spec_file = os.path.join(self.temp_dir, "api_spec.yaml")
         self.output_dir = os.path.join(self.temp_dir, "output")
@@ -179,10 +175,6 @@ class TestCliIntegration:
         with open(self.api_spec_file, "w") as f:
             yaml.dump(test_api_spec, f)
 
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
     @patch("ansible_waldur_generator.cli.Generator")
     def test_real_argument_parsing_integration(self, mock_generator_class):
         """Test real argument parsing with actual argparse."""
@@ -280,13 +272,10 @@ class TestCliHelp:
 class TestCliRealWorldScenarios:
     """Test CLI with real-world scenarios."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    @pytest.fixture(autouse=True)
+    def setup_temp_dir(self, tmp_path):
+        """Use pytest's per-test temporary directory for the test's files."""
+        self.temp_dir = str(tmp_path)
 
     @patch("ansible_waldur_generator.cli.Generator")
     def test_end_to_end_cli_flow(self, mock_generator_class):
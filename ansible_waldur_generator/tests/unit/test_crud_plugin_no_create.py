@@ -1,17 +1,13 @@
 import pytest
-import shutil
-import tempfile
 import os
 from ansible_waldur_generator.generator import Generator
 
 
 class TestCrudPluginNoCreate:
     @pytest.fixture
-    def temp_output_dir(self):
+    def temp_output_dir(self, tmp_path):
         """Create a temporary directory for test outputs."""
-        temp_dir = tempfile.mkdtemp()
-        yield temp_dir
-        shutil.rmtree(temp_dir, ignore_errors=True)
+        return str(tmp_path)
 
     @pytest.fixture
     def no_create_config(self):
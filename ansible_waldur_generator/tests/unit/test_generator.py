@@ -1,8 +1,6 @@
 """Integration tests for the Generator class and overall pipeline."""
 
 import os
-import tempfile
-import shutil
 from pathlib import Path
 from unittest.mock import Mock, patch
 import pytest
@@ -16,11 +14,9 @@ class TestGenerator:
     """Test suite for the Generator class."""
 
     @pytest.fixture
-    def temp_output_dir(self):
+    def temp_output_dir(self, tmp_path):
         """Create a temporary directory for test outputs."""
-        temp_dir = tempfile.mkdtemp()
-        yield temp_dir
-        shutil.rmtree(temp_dir, ignore_errors=True)
+        return str(tmp_path)
 
     @pytest.fixture
     def sample_config(self):
@@ -12,8 +12,6 @@ Each scenario corresponds to one upstream mastermind MR:
 """
 
 import os
-import shutil
-import tempfile
 
 import pytest
 
@@ -21,10 +19,8 @@ from ansible_waldur_generator.generator import Generator
 
 
 @pytest.fixture
-def temp_output_dir():
-    d = tempfile.mkdtemp()
-    yield d
-    shutil.rmtree(d, ignore_errors=True)
+def temp_output_dir(tmp_path):
+    return str(tmp_path)
 
 
 def _module_path(out_dir: str, namespace: str, name: str, module: str) -> str:
@@ -12,24 +12,174 @@ The tests use pytest with mocking to isolate the resolver's logic from
 actual API calls and focus on the parameter transformation logic.
 """
 
+import json
 import unittest.mock
+from types import MappingProxyType
 from unittest.mock import Mock
-from copy import deepcopy
+
+import pytest
+from ansible.module_utils.basic import AnsibleModule
 
 # Import the class under test
 from ansible_waldur_generator.interfaces.resolver import ParameterResolver
+from ansible_waldur_generator.interfaces.runner import BaseRunner
+
+# Module params of runners built without any; read-only so it cannot leak state.
+EMPTY_PARAMS = MappingProxyType({})
+
+# URL of the subnet that most resolution tests resolve to.
+SUBNET_URL = "http://127.0.0.1:8000/api/subnets/subnet-123/"
+
+# A subnet buried deep in nested dicts and lists, before and after resolution.
+# The resolver returns new structures, so the input can be shared as is.
+DEEP_INPUT = {"level1": {"level2": {"level3": [{"level4": {"subnet": "deep-subnet"}}]}}}
+DEEP_EXPECTED = {"level1": {"level2": {"level3": [{"level4": {"subnet": SUBNET_URL}}]}}}
+
+# Resolver configurations of a VM with ports and security groups filtered by
+# the offering's tenant. Read-only, so tests can safely share it.
+VM_RESOLVERS = MappingProxyType(
+    {
+        "offering": {
+            "url": "/api/marketplace-offerings/",
+            "error_message": "Offering '{value}' not found",
+        },
+        "project": {
+            "url": "/api/projects/",
+            "error_message": "Project '{value}' not found",
+        },
+        "subnet": {
+            "url": "/api/subnets/",
+            "error_message": "Subnet '{value}' not found",
+            "filter_by": [
+                {
+                    "source_param": "offering",
+                    "source_key": "scope_uuid",
+                    "target_key": "tenant_uuid",
+                }
+            ],
+        },
+        "security_groups": {
+            "url": "/api/security-groups/",
+            "error_message": "Security group '{value}' not found",
+            "is_list": True,
+            "list_item_keys": {"create": "url", "update_action": None},
+            "filter_by": [
+                {
+                    "source_param": "offering",
+                    "source_key": "scope_uuid",
+                    "target_key": "tenant_uuid",
+                }
+            ],
+        },
+    }
+)
+
+
+# Lookup results for the resolvers in `VM_RESOLVERS`, keyed by (path, value).
+# Shared by reference, so stubs must return copies of the items.
+VM_LOOKUP_RESULTS = MappingProxyType(
+    {
+        ("/api/marketplace-offerings/", "openstack-offering"): [
+            {
+                "uuid": "offering-123",
+                "scope_uuid": "tenant-456",
+                "url": "/api/marketplace-offerings/offering-123/",
+            }
+        ],
+        ("/api/projects/", "test-project"): [
+            {"uuid": "project-789", "url": "/api/projects/project-789/"}
+        ],
+        ("/api/subnets/", "private-subnet-A"): [
+            {"uuid": "subnet-123", "url": "/api/subnets/subnet-123/"}
+        ],
+        ("/api/subnets/", "private-subnet-B"): [
+            {"uuid": "subnet-456", "url": "/api/subnets/subnet-456/"}
+        ],
+        ("/api/security-groups/", "sg-web"): [
+            {"uuid": "sg-123", "url": "/api/security-groups/sg-123/"}
+        ],
+        ("/api/security-groups/", "sg-db"): [
+            {"uuid": "sg-456", "url": "/api/security-groups/sg-456/"}
+        ],
+        ("/api/security-groups/", "sg-admin"): [
+            {"uuid": "sg-789", "url": "/api/security-groups/sg-789/"}
+        ],
+    }
+)
+
+# The VM's ports once their subnets and security groups are resolved.
+VM_EXPECTED = {
+    "ports": [
+        {
+            "subnet": "/api/subnets/subnet-123/",
+            "security_groups": [
+                {"url": "/api/security-groups/sg-123/"},
+                {"url": "/api/security-groups/sg-456/"},
+            ],
+            "description": "Web server port",
+        },
+        {
+            "subnet": "/api/subnets/subnet-456/",
+            "security_groups": [{"url": "/api/security-groups/sg-789/"}],
+            "description": "Admin port",
+        },
+    ]
+}
+
+
+def _update_resolve_to_list(path, value, query_params=None, resolver_conf=None):
+    """
+    Finds the new subnet of the update scenario, but only when the lookup is
+    filtered by the tenant of the offering primed from the existing resource.
+    """
+    if "subnets" in path and value == "new-subnet":
+        if query_params and query_params.get("tenant_uuid") == "tenant-456":
+            return [{"uuid": "subnet-new", "url": "/api/subnets/subnet-new/"}]
+    return []
+
+
+def _build_runner(resolvers=None, params=None, is_uuid=False):
+    """
+    Builds a mock runner with the given resolver configurations and module
+    parameters. `is_uuid` sets what the runner's UUID check returns for every value.
+    Without `params`, the module gets a shared read-only empty mapping.
+
+    The runner and its module are specced against the real classes, so a
+    test using a misspelled or non-existent attribute fails loudly.
+    """
+    return Mock(
+        spec=BaseRunner,
+        module=Mock(
+            spec=AnsibleModule, params=EMPTY_PARAMS if params is None else params
+        ),
+        context={"resolvers": {} if resolvers is None else resolvers},
+        _is_uuid=Mock(return_value=is_uuid),
+    )
+
+
+@pytest.fixture
+def make_runner():
+    """Factory fixture building a fresh mock runner, see `_build_runner`."""
+    return _build_runner
+
+
+@pytest.fixture(scope="module")
+def empty_resolver():
+    """
+    A resolver without any resolver configurations, shared by the tests that
+    only pass values through it. Tests that stub resolver methods or touch its
+    cache must build their own resolver instead.
+    """
+    return ParameterResolver(_build_runner())
 
 
 class TestParameterResolverInitialization:
     """Test the initialization and basic setup of ParameterResolver."""
 
-    def test_init_with_runner(self):
+    def test_init_with_runner(self, make_runner):
         """Test that ParameterResolver initializes correctly with a runner."""
         # Arrange
-        mock_runner = Mock()
-        mock_runner.module = Mock()
-        mock_runner.module.params = {}
-        mock_runner.context = {"resolvers": {}}
+        mock_runner = make_runner()
 
         # Act
         resolver = ParameterResolver(mock_runner)
@@ -43,12 +193,9 @@ class TestParameterResolverInitialization:
     def test_init_preserves_runner_references(self):
         """Test that the resolver maintains proper references to runner components."""
         # Arrange
-        mock_module = Mock()
+        mock_module = Mock(spec=AnsibleModule, params={})
         mock_context = {"resolvers": {"test": {}}}
-        mock_runner = Mock()
-        mock_runner.module = mock_module
-        mock_runner.module.params = {}
-        mock_runner.context = mock_context
+        mock_runner = Mock(spec=BaseRunner, module=mock_module, context=mock_context)
 
         # Act
         resolver = ParameterResolver(mock_runner)
@@ -57,16 +204,29 @@ class TestParameterResolverInitialization:
         assert resolver.module is mock_module
         assert resolver.context is mock_context
 
+    def test_resolve_fails_without_resolvers_in_context(self, make_runner):
+        """Test that resolving with a context lacking resolvers fails the module."""
+        # Arrange
+        mock_runner = make_runner()
+        mock_runner.context = {}
+        resolver = ParameterResolver(mock_runner)
+
+        # Act
+        resolver.resolve("subnet", "private-subnet-A")
+
+        # Assert
+        mock_runner.module.fail_json.assert_called_once_with(
+            msg="Internal configuration error: the module context defines no resolvers."
+        )
+
 
 class TestCachePriming:
     """Test the cache priming functionality from existing resources."""
 
-    def test_prime_cache_from_resource_single_key(self):
+    def test_prime_cache_from_resource_single_key(self, make_runner):
         """Test priming cache with a single dependency key."""
         # Arrange
-        mock_runner = Mock()
-        mock_runner.module = Mock()
-        mock_runner.context = {"resolvers": {}}
+        mock_runner = make_runner()
         mock_runner.send_request = Mock(
             return_value=({"uuid": "offering-123", "name": "test-offering"}, 200)
         )
@@ -86,29 +246,25 @@ class TestCachePriming:
         assert "offering" in resolver.cache
         assert resolver.cache["offering"]["uuid"] == "offering-123"
 
-    def test_prime_cache_from_resource_multiple_keys(self):
+    def test_prime_cache_from_resource_multiple_keys(self, make_runner):
         """Test priming cache with multiple dependency keys."""
         # Arrange
-        mock_runner = Mock()
-        mock_runner.module = Mock()
-        mock_runner.context = {"resolvers": {}}
-
-        # Mock different responses for different URLs
-        def mocksend_request(method, url):
-            if "offerings" in url:
-                return (
+        mock_runner = make_runner()
+
+        # The keys are fetched in the given order, one response per request.
+        mock_runner.send_request = Mock(
+            side_effect=[
+                (
                     {
                         "uuid": "offering-123",
                         "name": "test-offering",
                         "scope_uuid": "tenant-456",
                     },
                     200,
-                )
-            elif "projects" in url:
-                return ({"uuid": "project-789", "name": "test-project"}, 200)
-            return None
-
-        mock_runner.send_request = Mock(side_effect=mocksend_request)
+                ),
+                ({"uuid": "project-789", "name": "test-project"}, 200),
+            ]
+        )
 
         resolver = ParameterResolver(mock_runner)
         resource = {
@@ -120,18 +276,23 @@ class TestCachePriming:
         resolver.prime_cache_from_resource(resource, ["offering", "project"])
 
         # Assert
-        assert mock_runner.send_request.call_count == 2
+        assert mock_runner.send_request.call_args_list == [
+            unittest.mock.call(
+                "GET", "http://127.0.0.1:8000/api/marketplace-offerings/offering-123/"
+            ),
+            unittest.mock.call(
+                "GET", "http://127.0.0.1:8000/api/projects/project-789/"
+            ),
+        ]
         assert "offering" in resolver.cache
         assert "project" in resolver.cache
         assert resolver.cache["offering"]["uuid"] == "offering-123"
         assert resolver.cache["project"]["uuid"] == "project-789"
 
-    def test_prime_cache_skips_already_cached(self):
+    def test_prime_cache_skips_already_cached(self, make_runner):
         """Test that cache priming skips keys that are already in cache."""
         # Arrange
-        mock_runner = Mock()
-        mock_runner.module = Mock()
-        mock_runner.context = {"resolvers": {}}
+        mock_runner = make_runner()
         mock_runner.send_request = Mock(return_value=({"uuid": "new-data"}, 200))
 
         resolver = ParameterResolver(mock_runner)
@@ -152,21 +313,19 @@ class TestCachePriming:
 class TestSimpleResolution:
     """Test the resolve_to_url method for simple parameter resolution."""
 
-    def test_resolve_to_url_with_uuid(self):
+    def test_resolve_to_url_with_uuid(self, make_runner):
         """Test resolving a UUID directly to URL without API call."""
         # Arrange
-        mock_runner = Mock()
-        mock_runner.module = Mock()
-        mock_runner.module.params = {"api_url": "http://127.0.0.1:8000/"}
-        mock_runner.context = {
-            "resolvers": {
+        mock_runner = make_runner(
+            resolvers={
                 "customer": {
                     "url": "/api/customers/",
                     "error_message": "Customer '{value}' not found",
                 }
-            }
-        }
-        mock_runner._is_uuid = Mock(return_value=True)
+            },
+            params={"api_url": "http://127.0.0.1:8000/"},
+            is_uuid=True,
+        )
 
         resolver = ParameterResolver(mock_runner)
 
@@ -183,21 +342,17 @@ class TestSimpleResolution:
         # Should not make any API calls for UUID resolution
         mock_runner.send_request.assert_not_called()
 
-    def test_resolve_to_url_with_name_single_result(self):
+    def test_resolve_to_url_with_name_single_result(self, make_runner):
         """Test resolving a name to URL with single API result."""
         # Arrange
-        mock_runner = Mock()
-        mock_runner.module = Mock()
-        mock_runner.module.params = {}
-        mock_runner.context = {
-            "resolvers": {
+        mock_runner = make_runner(
+            resolvers={
                 "customer": {
                     "url": "/api/customers/",
                     "error_message": "Customer '{value}' not found",
                 }
             }
-        }
-        mock_runner._is_uuid = Mock(return_value=False)
+        )
         mock_runner.send_request = Mock(
             return_value=(
                 [
@@ -221,77 +376,53 @@ class TestSimpleResolution:
         )
         assert result == "http://127.0.0.1:8000/api/customers/customer-123/"
 
-    def test_resolve_to_url_with_name_multiple_results(self):
-        """Test resolving a name with multiple results (should warn and use first)."""
-        # Arrange
-        mock_runner = Mock()
-        mock_runner.module = Mock()
-        mock_runner.module.params = {}
-        mock_runner.context = {
-            "resolvers": {
-                "project": {
-                    "url": "/api/projects/",
-                    "error_message": "Project '{value}' not found",
-                }
-            }
-        }
-        mock_runner._is_uuid = Mock(return_value=False)
-        mock_runner.send_request = Mock(
-            return_value=(
+    @pytest.mark.parametrize(
+        "results, expected_msg",
+        [
+            pytest.param(
+                [],
+                "Customer 'test-customer' not found",
+                id="no_results",
+            ),
+            pytest.param(
                 [
                     {
-                        "url": "http://127.0.0.1:8000/api/projects/project-123/",
-                        "name": "test-project",
+                        "url": "http://127.0.0.1:8000/api/customers/customer-123/",
+                        "name": "test-customer",
                     },
                     {
-                        "url": "http://127.0.0.1:8000/api/projects/project-456/",
-                        "name": "test-project",
+                        "url": "http://127.0.0.1:8000/api/customers/customer-456/",
+                        "name": "test-customer",
                     },
                 ],
-                200,
-            )
-        )
-
-        resolver = ParameterResolver(mock_runner)
-
-        # Act
-        resolver.resolve_to_url("project", "test-project")
-
-        # Assert
-        mock_runner.module.fail_json.assert_called_once_with(
-            msg="Multiple resources found for 'test-project' (parameter 'project'). Found 2 matches. This resource name is not unique. Please use a UUID for precise identification, or ensure the resource name is unique."
-        )
-
-    def test_resolve_to_url_no_results_fails(self):
-        """Test that resolution fails when no results are found."""
+                "Multiple resources found for 'test-customer' (parameter 'customer'). Found 2 matches. This resource name is not unique. Please use a UUID for precise identification, or ensure the resource name is unique.",
+                id="multiple_results",
+            ),
+        ],
+    )
+    def test_resolve_to_url_with_name_fails(self, make_runner, results, expected_msg):
+        """Test that resolution fails unless a name matches exactly one resource."""
         # Arrange
-        mock_runner = Mock()
-        mock_runner.module = Mock()
-        mock_runner.context = {
-            "resolvers": {
+        mock_runner = make_runner(
+            resolvers={
                 "customer": {
                     "url": "/api/customers/",
                     "error_message": "Customer '{value}' not found",
                 }
             }
-        }
-        mock_runner._is_uuid = Mock(return_value=False)
-        mock_runner.send_request = Mock(return_value=([], 200))
+        )
+        mock_runner.send_request = Mock(return_value=(results, 200))
 
         resolver = ParameterResolver(mock_runner)
 
         # Act & Assert
-        resolver.resolve_to_url("customer", "nonexistent-customer")
-        mock_runner.module.fail_json.assert_called_once_with(
-            msg="Customer 'nonexistent-customer' not found"
-        )
+        resolver.resolve_to_url("customer", "test-customer")
+        mock_runner.module.fail_json.assert_called_once_with(msg=expected_msg)
 
-    def test_resolve_to_url_missing_resolver_config_fails(self):
+    def test_resolve_to_url_missing_resolver_config_fails(self, make_runner):
         """Test that resolution fails when no resolver config exists for parameter."""
         # Arrange
-        mock_runner = Mock()
-        mock_runner.module = Mock()
-        mock_runner.context = {"resolvers": {}}
+        mock_runner = make_runner()
 
         resolver = ParameterResolver(mock_runner)
 
@@ -305,26 +436,21 @@ class TestSimpleResolution:
 class TestRecursiveResolution:
     """Test the main recursive resolve method for complex data structures."""
 
-    def test_resolve_primitive_with_resolver(self):
+    def test_resolve_primitive_with_resolver(self, make_runner):
         """Test resolving a primitive value that has a resolver configuration."""
         # Arrange
-        mock_runner = Mock()
-        mock_runner.module = Mock()
-        mock_runner.module.params = {}
-        mock_runner.context = {
-            "resolvers": {
+        mock_runner = make_runner(
+            resolvers={
                 "subnet": {
                     "url": "/api/subnets/",
                     "error_message": "Subnet '{value}' not found",
                 }
             }
-        }
+        )
 
         resolver = ParameterResolver(mock_runner)
         # Mock the single value resolution
-        resolver._resolve_single_value = Mock(
-            return_value="http://127.0.0.1:8000/api/subnets/subnet-123/"
-        )
+        resolver._resolve_single_value = Mock(return_value=SUBNET_URL)
 
         # Act
         result = resolver.resolve("subnet", "private-subnet-A")
@@ -333,18 +459,15 @@ class TestRecursiveResolution:
         resolver._resolve_single_value.assert_called_once_with(
             "subnet",
             "private-subnet-A",
-            resolver.context["resolvers"]["subnet"],
+            resolver.resolvers["subnet"],
             output_format="create",
         )
-        assert result == "http://127.0.0.1:8000/api/subnets/subnet-123/"
+        assert result == SUBNET_URL
 
-    def test_resolve_primitive_without_resolver(self):
+    def test_resolve_primitive_without_resolver(self, make_runner):
         """Test resolving a primitive value with no resolver (should return unchanged)."""
         # Arrange
-        mock_runner = Mock()
-        mock_runner.module = Mock()
-        mock_runner.module.params = {}
-        mock_runner.context = {"resolvers": {}}
+        mock_runner = make_runner()
 
         resolver = ParameterResolver(mock_runner)
 
@@ -354,25 +477,20 @@ class TestRecursiveResolution:
         # Assert
         assert result == "This is a description"
 
-    def test_resolve_dictionary(self):
+    def test_resolve_dictionary(self, make_runner):
         """Test recursive resolution of a dictionary structure."""
         # Arrange
-        mock_runner = Mock()
-        mock_runner.module = Mock()
-        mock_runner.module.params = {}
-        mock_runner.context = {
-            "resolvers": {
+        mock_runner = make_runner(
+            resolvers={
                 "subnet": {
                     "url": "/api/subnets/",
                     "error_message": "Subnet '{value}' not found",
                 }
             }
-        }
+        )
 
         resolver = ParameterResolver(mock_runner)
-        resolver._resolve_single_value = Mock(
-            return_value="http://127.0.0.1:8000/api/subnets/subnet-123/"
-        )
+        resolver._resolve_single_value = Mock(return_value=SUBNET_URL)
 
         input_dict = {
             "subnet": "private-subnet-A",
@@ -385,7 +503,7 @@ class TestRecursiveResolution:
 
         # Assert
         expected = {
-            "subnet": "http://127.0.0.1:8000/api/subnets/subnet-123/",
+            "subnet": SUBNET_URL,
             "description": "Port description",
             "floating_ip": True,
         }
@@ -393,25 +511,22 @@ class TestRecursiveResolution:
         resolver._resolve_single_value.assert_called_once_with(
             "subnet",
             "private-subnet-A",
-            resolver.context["resolvers"]["subnet"],
+            resolver.resolvers["subnet"],
             output_format="create",
         )
 
-    def test_resolve_list_of_primitives_with_is_list_config(self):
+    def test_resolve_list_of_primitives_with_is_list_config(self, make_runner):
         """Test resolving a list of simple values with is_list configuration."""
         # Arrange
-        mock_runner = Mock()
-        mock_runner.module = Mock()
-        mock_runner.module.params = {}
-        mock_runner.context = {
-            "resolvers": {
+        mock_runner = make_runner(
+            resolvers={
                 "security_groups": {
                     "url": "/api/security-groups/",
                     "error_message": "Security group '{value}' not found",
                     "is_list": True,
                 }
             }
-        }
+        )
 
         resolver = ParameterResolver(mock_runner)
         resolver._resolve_single_value = Mock(
@@ -434,25 +549,22 @@ class TestRecursiveResolution:
         assert result == expected
         assert resolver._resolve_single_value.call_count == 2
 
-    def test_resolve_list_of_objects(self):
+    def test_resolve_list_of_objects(self, make_runner):
         """Test resolving a list of complex objects (recursive case)."""
         # Arrange
-        mock_runner = Mock()
-        mock_runner.module = Mock()
-        mock_runner.module.params = {}
-        mock_runner.context = {
-            "resolvers": {
+        mock_runner = make_runner(
+            resolvers={
                 "subnet": {
                     "url": "/api/subnets/",
                     "error_message": "Subnet '{value}' not found",
                 }
             }
-        }
+        )
 
         resolver = ParameterResolver(mock_runner)
         resolver._resolve_single_value = Mock(
             side_effect=[
-                "http://127.0.0.1:8000/api/subnets/subnet-123/",
+                SUBNET_URL,
                 "http://127.0.0.1:8000/api/subnets/subnet-456/",
             ]
         )
@@ -468,7 +580,7 @@ class TestRecursiveResolution:
         # Assert
         expected = [
             {
-                "subnet": "http://127.0.0.1:8000/api/subnets/subnet-123/",
+                "subnet": SUBNET_URL,
                 "description": "Port 1",
             },
             {
@@ -478,14 +590,11 @@ class TestRecursiveResolution:
         ]
         assert result == expected
 
-    def test_resolve_nested_complex_structure(self):
+    def test_resolve_nested_complex_structure(self, make_runner):
         """Test resolving a deeply nested structure with mixed types."""
         # Arrange
-        mock_runner = Mock()
-        mock_runner.module = Mock()
-        mock_runner.module.params = {}
-        mock_runner.context = {
-            "resolvers": {
+        mock_runner = make_runner(
+            resolvers={
                 "subnet": {
                     "url": "/api/subnets/",
                     "error_message": "Subnet '{value}' not found",
@@ -496,12 +605,12 @@ class TestRecursiveResolution:
                     "is_list": True,
                 },
             }
-        }
+        )
 
         resolver = ParameterResolver(mock_runner)
         resolver._resolve_single_value = Mock(
             side_effect=[
-                "http://127.0.0.1:8000/api/subnets/subnet-123/",
+                SUBNET_URL,
                 "http://127.0.0.1:8000/api/security-groups/sg-123/",
                 "http://127.0.0.1:8000/api/security-groups/sg-456/",
             ]
@@ -521,7 +630,7 @@ class TestRecursiveResolution:
         expected = {
             "ports": [
                 {
-                    "subnet": "http://127.0.0.1:8000/api/subnets/subnet-123/",
+                    "subnet": SUBNET_URL,
                     "security_groups": [
                         "http://127.0.0.1:8000/api/security-groups/sg-123/",
                         "http://127.0.0.1:8000/api/security-groups/sg-456/",
@@ -532,24 +641,66 @@ class TestRecursiveResolution:
         }
         assert result == expected
 
+    def test_resolve_large_structure_visits_each_value_once(self, make_runner):
+        """Test that resolving a large structure resolves every leaf exactly once."""
+        # Arrange
+        mock_runner = make_runner(
+            resolvers={
+                "subnet": {
+                    "url": "/api/subnets/",
+                    "error_message": "Subnet '{value}' not found",
+                },
+                "security_groups": {
+                    "url": "/api/security-groups/",
+                    "error_message": "Security group '{value}' not found",
+                    "is_list": True,
+                },
+            }
+        )
+
+        resolver = ParameterResolver(mock_runner)
+        resolver._resolve_single_value = Mock(
+            side_effect=lambda param_name, value, *args, **kwargs: f"/api/{value}/"
+        )
+
+        input_data = {
+            "ports": [
+                {
+                    "subnet": f"subnet-{i}",
+                    "security_groups": [f"sg-{i}-{j}" for j in range(5)],
+                }
+                for i in range(1000)
+            ]
+        }
+
+        # Act
+        result = resolver.resolve("vm_config", input_data)
+
+        # Assert
+        # One lookup per subnet and per security group, with no re-walks.
+        assert resolver._resolve_single_value.call_count == 1000 * 6
+        assert result["ports"][999] == {
+            "subnet": "/api/subnet-999/",
+            "security_groups": [f"/api/sg-999-{j}/" for j in range(5)],
+        }
+        # The input structure is left untouched.
+        assert input_data["ports"][999]["subnet"] == "subnet-999"
+
 
 class TestSingleValueResolution:
     """Test the _resolve_single_value method that handles individual parameter resolution."""
 
-    def test_resolve_single_value_basic_resolution(self):
+    def test_resolve_single_value_basic_resolution(self, make_runner):
         """Test basic single value resolution without dependencies."""
         # Arrange
-        mock_runner = Mock()
-        mock_runner.module = Mock()
-        mock_runner.module.params = {}
-        mock_runner.context = {"resolvers": {}}
+        mock_runner = make_runner()
 
         resolver = ParameterResolver(mock_runner)
         resolver._build_dependency_filters = Mock(return_value={})
         resolver._resolve_to_list = Mock(
             return_value=[
                 {
-                    "url": "http://127.0.0.1:8000/api/subnets/subnet-123/",
+                    "url": SUBNET_URL,
                     "name": "test-subnet",
                 }
             ]
@@ -564,19 +715,16 @@ class TestSingleValueResolution:
         result = resolver._resolve_single_value("subnet", "test-subnet", resolver_conf)
 
         # Assert
-        assert result == "http://127.0.0.1:8000/api/subnets/subnet-123/"
+        assert result == SUBNET_URL
         resolver._build_dependency_filters.assert_called_once_with("subnet", [])
         resolver._resolve_to_list.assert_called_once_with(
             "/api/subnets/", "test-subnet", {}, resolver_conf
         )
 
-    def test_resolve_single_value_with_dependencies(self):
+    def test_resolve_single_value_with_dependencies(self, make_runner):
         """Test single value resolution with dependency filtering."""
         # Arrange
-        mock_runner = Mock()
-        mock_runner.module = Mock()
-        mock_runner.module.params = {}
-        mock_runner.context = {"resolvers": {}}
+        mock_runner = make_runner()
 
         resolver = ParameterResolver(mock_runner)
         resolver._build_dependency_filters = Mock(
@@ -615,17 +763,14 @@ class TestSingleValueResolution:
             "/api/flavors/", "test-flavor", {"tenant_uuid": "tenant-456"}, resolver_conf
         )
 
-    def test_resolve_single_value_uses_cache(self):
+    def test_resolve_single_value_uses_cache(self, make_runner):
         """Test that single value resolution uses cached results when available."""
         # Arrange
-        mock_runner = Mock()
-        mock_runner.module = Mock()
-        mock_runner.module.params = {}
-        mock_runner.context = {"resolvers": {}}
+        mock_runner = make_runner()
 
         resolver = ParameterResolver(mock_runner)
         resolver.cache[("subnet", "test-subnet")] = {
-            "url": "http://127.0.0.1:8000/api/subnets/subnet-123/",
+            "url": SUBNET_URL,
             "name": "test-subnet",
         }
         resolver._build_dependency_filters = Mock(return_value={})
@@ -640,16 +785,13 @@ class TestSingleValueResolution:
         result = resolver._resolve_single_value("subnet", "test-subnet", resolver_conf)
 
         # Assert
-        assert result == "http://127.0.0.1:8000/api/subnets/subnet-123/"
+        assert result == SUBNET_URL
         resolver._resolve_to_list.assert_not_called()
 
-    def test_resolve_single_value_is_list_configuration(self):
+    def test_resolve_single_value_is_list_configuration(self, make_runner):
         """Test single value resolution with is_list and list_item_key configuration."""
         # Arrange
-        mock_runner = Mock()
-        mock_runner.module = Mock()
-        mock_runner.module.params = {}
-        mock_runner.context = {"resolvers": {}}
+        mock_runner = make_runner()
 
         resolver = ParameterResolver(mock_runner)
         resolver._build_dependency_filters = Mock(return_value={})
@@ -678,17 +820,14 @@ class TestSingleValueResolution:
         expected = {"url": "http://127.0.0.1:8000/api/security-groups/sg-123/"}
         assert result == expected
 
-    def test_resolve_single_value_object_item_keys(self):
+    def test_resolve_single_value_object_item_keys(self, make_runner):
         """Test single value resolution with object_item_keys wraps URL in a dict.
 
         This covers the case where a non-list resolver maps to an object type
         (e.g., server_group), which expects {"url": "..."} instead of a plain URL string.
         """
         # Arrange
-        mock_runner = Mock()
-        mock_runner.module = Mock()
-        mock_runner.module.params = {}
-        mock_runner.context = {"resolvers": {}}
+        mock_runner = make_runner()
 
         resolver = ParameterResolver(mock_runner)
         resolver._build_dependency_filters = Mock(return_value={})
@@ -717,13 +856,10 @@ class TestSingleValueResolution:
         expected = {"url": "http://127.0.0.1:8000/api/openstack-server-groups/sg-123/"}
         assert result == expected
 
-    def test_resolve_single_value_object_item_keys_no_match(self):
+    def test_resolve_single_value_object_item_keys_no_match(self, make_runner):
         """Test that object_item_keys does not wrap when output_format doesn't match."""
         # Arrange
-        mock_runner = Mock()
-        mock_runner.module = Mock()
-        mock_runner.module.params = {}
-        mock_runner.context = {"resolvers": {}}
+        mock_runner = make_runner()
 
         resolver = ParameterResolver(mock_runner)
         resolver._build_dependency_filters = Mock(return_value={})
@@ -754,17 +890,38 @@ class TestSingleValueResolution:
         # Assert — should return plain URL since no key for update_action
         assert result == "http://127.0.0.1:8000/api/openstack-server-groups/sg-123/"
 
-    def test_resolve_single_value_no_results_fails(self):
-        """Test that single value resolution fails when no results are found."""
+    @pytest.mark.parametrize(
+        "results, expected_msg",
+        [
+            pytest.param(
+                [],
+                "Subnet 'test-subnet' not found",
+                id="no_results",
+            ),
+            pytest.param(
+                [
+                    {
+                        "url": SUBNET_URL,
+                        "name": "test-subnet",
+                    },
+                    {
+                        "url": "http://127.0.0.1:8000/api/subnets/subnet-456/",
+                        "name": "test-subnet",
+                    },
+                ],
+                "Multiple resources found for 'test-subnet' (parameter 'subnet'). Found 2 matches. This resource name is not unique. Please use a UUID for precise identification, or ensure the resource name is unique.",
+                id="multiple_results",
+            ),
+        ],
+    )
+    def test_resolve_single_value_fails(self, make_runner, results, expected_msg):
+        """Test that single value resolution fails unless exactly one result is found."""
         # Arrange
-        mock_runner = Mock()
-        mock_runner.module = Mock()
-        mock_runner.module.params = {}
-        mock_runner.context = {"resolvers": {}}
+        mock_runner = make_runner()
 
         resolver = ParameterResolver(mock_runner)
         resolver._build_dependency_filters = Mock(return_value={})
-        resolver._resolve_to_list = Mock(return_value=[])
+        resolver._resolve_to_list = Mock(return_value=results)
 
         resolver_conf = {
             "url": "/api/subnets/",
@@ -772,61 +929,20 @@ class TestSingleValueResolution:
         }
 
         # Act & Assert
-        resolver._resolve_single_value("subnet", "nonexistent-subnet", resolver_conf)
-        mock_runner.module.fail_json.assert_called_once_with(
-            msg="Subnet 'nonexistent-subnet' not found"
-        )
-
-    def test_resolve_single_value_multiple_results_warns(self):
-        """Test that single value resolution warns when multiple results are found."""
-        # Arrange
-        mock_runner = Mock()
-        mock_runner.module = Mock()
-        mock_runner.module.params = {}
-        mock_runner.context = {"resolvers": {}}
-
-        resolver = ParameterResolver(mock_runner)
-        resolver._build_dependency_filters = Mock(return_value={})
-        resolver._resolve_to_list = Mock(
-            return_value=[
-                {
-                    "url": "http://127.0.0.1:8000/api/subnets/subnet-123/",
-                    "name": "test-subnet",
-                },
-                {
-                    "url": "http://127.0.0.1:8000/api/subnets/subnet-456/",
-                    "name": "test-subnet",
-                },
-            ]
-        )
-
-        resolver_conf = {
-            "url": "/api/subnets/",
-            "error_message": "Subnet '{value}' not found",
-        }
-
-        # Act
         resolver._resolve_single_value("subnet", "test-subnet", resolver_conf)
+        mock_runner.module.fail_json.assert_called_once_with(msg=expected_msg)
 
-        # Assert
-        mock_runner.module.fail_json.assert_called_once_with(
-            msg="Multiple resources found for 'test-subnet' (parameter 'subnet'). Found 2 matches. This resource name is not unique. Please use a UUID for precise identification, or ensure the resource name is unique."
-        )
-
-    def test_resolve_single_value_caches_result(self):
+    def test_resolve_single_value_caches_result(self, make_runner):
         """Test that single value resolution caches its results properly."""
         # Arrange
-        mock_runner = Mock()
-        mock_runner.module = Mock()
-        mock_runner.module.params = {"subnet": "test-subnet"}  # Make params dict-like
-        mock_runner.context = {"resolvers": {}}
+        mock_runner = make_runner(params={"subnet": "test-subnet"})
 
         resolver = ParameterResolver(mock_runner)
         resolver._build_dependency_filters = Mock(return_value={})
         resolver._resolve_to_list = Mock(
             return_value=[
                 {
-                    "url": "http://127.0.0.1:8000/api/subnets/subnet-123/",
+                    "url": SUBNET_URL,
                     "name": "test-subnet",
                 }
             ]
@@ -841,25 +957,23 @@ class TestSingleValueResolution:
         result = resolver._resolve_single_value("subnet", "test-subnet", resolver_conf)
 
         # Assert
-        assert result == "http://127.0.0.1:8000/api/subnets/subnet-123/"
+        assert result == SUBNET_URL
         # Check that both cache entries are created
         assert ("subnet", "test-subnet") in resolver.cache
         assert "subnet" in resolver.cache  # Top-level parameter cache
 
-    def test_resolve_single_value_without_top_level_param_caching(self):
+    def test_resolve_single_value_without_top_level_param_caching(self, make_runner):
         """Test single value resolution when param is not in module.params."""
         # Arrange
-        mock_runner = Mock()
-        mock_runner.module = Mock()
-        mock_runner.module.params = {}  # Empty params - subnet not in top-level
-        mock_runner.context = {"resolvers": {}}
+        # Empty params - subnet not in top-level
+        mock_runner = make_runner()
 
         resolver = ParameterResolver(mock_runner)
         resolver._build_dependency_filters = Mock(return_value={})
         resolver._resolve_to_list = Mock(
             return_value=[
                 {
-                    "url": "http://127.0.0.1:8000/api/subnets/subnet-123/",
+                    "url": SUBNET_URL,
                     "name": "nested-subnet",
                 }
             ]
@@ -876,7 +990,7 @@ class TestSingleValueResolution:
         )
 
         # Assert
-        assert result == "http://127.0.0.1:8000/api/subnets/subnet-123/"
+        assert result == SUBNET_URL
         # Only tuple cache entry should exist, not top-level
         assert ("subnet", "nested-subnet") in resolver.cache
         assert "subnet" not in resolver.cache  # Should NOT create top-level cache entry
@@ -885,19 +999,16 @@ class TestSingleValueResolution:
 class TestResolveToList:
     """Test the _resolve_to_list helper method."""
 
-    def test_resolve_to_list_with_uuid(self):
+    def test_resolve_to_list_with_uuid(self, make_runner):
         """Test resolving to list using UUID (direct GET request)."""
         # Arrange
-        mock_runner = Mock()
-        mock_runner.module = Mock()
-        mock_runner.context = {"resolvers": {}}
-        mock_runner._is_uuid = Mock(return_value=True)
+        mock_runner = make_runner(is_uuid=True)
         mock_runner.send_request = Mock(
             return_value=(
                 {
                     "uuid": "subnet-123",
                     "name": "test-subnet",
-                    "url": "http://127.0.0.1:8000/api/subnets/subnet-123/",
+                    "url": SUBNET_URL,
                 },
                 200,
             )
@@ -920,18 +1031,15 @@ class TestResolveToList:
             {
                 "uuid": "subnet-123",
                 "name": "test-subnet",
-                "url": "http://127.0.0.1:8000/api/subnets/subnet-123/",
+                "url": SUBNET_URL,
             }
         ]
         assert result == expected
 
-    def test_resolve_to_list_with_uuid_not_found(self):
+    def test_resolve_to_list_with_uuid_not_found(self, make_runner):
         """Test resolving to list with UUID when resource doesn't exist."""
         # Arrange
-        mock_runner = Mock()
-        mock_runner.module = Mock()
-        mock_runner.context = {"resolvers": {}}
-        mock_runner._is_uuid = Mock(return_value=True)
+        mock_runner = make_runner(is_uuid=True)
         mock_runner.send_request = Mock(return_value=(None, 200))
 
         resolver = ParameterResolver(mock_runner)
@@ -944,151 +1052,83 @@ class TestResolveToList:
         # Assert
         assert result == []
 
-    def test_resolve_to_list_with_name_and_filters(self):
-        """Test resolving to list using name with additional query filters."""
+    @pytest.mark.parametrize(
+        "path, value, filters, api_result, expected_query, expected",
+        [
+            pytest.param(
+                "/api/subnets/",
+                "test-subnet",
+                {"tenant_uuid": "tenant-456"},
+                [{"uuid": "subnet-123", "name": "test-subnet"}],
+                {"name_exact": "test-subnet", "tenant_uuid": "tenant-456"},
+                [{"uuid": "subnet-123", "name": "test-subnet"}],
+                id="with_filters",
+            ),
+            pytest.param(
+                "/api/projects/",
+                "test-project",
+                None,
+                [{"uuid": "project-123", "name": "test-project"}],
+                {"name_exact": "test-project"},
+                [{"uuid": "project-123", "name": "test-project"}],
+                id="no_filters",
+            ),
+            pytest.param(
+                "/api/projects/",
+                "test-project",
+                None,
+                None,
+                {"name_exact": "test-project"},
+                [],
+                id="api_returns_none",
+            ),
+        ],
+    )
+    def test_resolve_to_list_with_name(
+        self, make_runner, path, value, filters, api_result, expected_query, expected
+    ):
+        """Test resolving to list using a name, with optional additional query filters."""
         # Arrange
-        mock_runner = Mock()
-        mock_runner.module = Mock()
-        mock_runner.context = {"resolvers": {}}
-        mock_runner._is_uuid = Mock(return_value=False)
-        mock_runner.send_request = Mock(
-            return_value=([{"uuid": "subnet-123", "name": "test-subnet"}], 200)
-        )
+        mock_runner = make_runner()
+        mock_runner.send_request = Mock(return_value=(api_result, 200))
 
         resolver = ParameterResolver(mock_runner)
 
         # Act
-        result = resolver._resolve_to_list(
-            "/api/subnets/", "test-subnet", {"tenant_uuid": "tenant-456"}
-        )
+        if filters is None:
+            result = resolver._resolve_to_list(path, value)
+        else:
+            result = resolver._resolve_to_list(path, value, filters)
 
         # Assert
-        expected_query = {"name_exact": "test-subnet", "tenant_uuid": "tenant-456"}
         mock_runner.send_request.assert_called_once_with(
-            "GET", "/api/subnets/", query_params=expected_query
+            "GET", path, query_params=expected_query
         )
-        assert result == [{"uuid": "subnet-123", "name": "test-subnet"}]
-
-    def test_resolve_to_list_with_name_no_filters(self):
-        """Test resolving to list using name without additional filters."""
-        # Arrange
-        mock_runner = Mock()
-        mock_runner.module = Mock()
-        mock_runner.context = {"resolvers": {}}
-        mock_runner._is_uuid = Mock(return_value=False)
-        mock_runner.send_request = Mock(
-            return_value=([{"uuid": "project-123", "name": "test-project"}], 200)
-        )
-
-        resolver = ParameterResolver(mock_runner)
-
-        # Act
-        result = resolver._resolve_to_list("/api/projects/", "test-project")
-
-        # Assert
-        expected_query = {"name_exact": "test-project"}
-        mock_runner.send_request.assert_called_once_with(
-            "GET", "/api/projects/", query_params=expected_query
-        )
-        assert result == [{"uuid": "project-123", "name": "test-project"}]
-
-    def test_resolve_to_list_api_returns_none(self):
-        """Test resolving to list when API returns None."""
-        # Arrange
-        mock_runner = Mock()
-        mock_runner.module = Mock()
-        mock_runner.context = {"resolvers": {}}
-        mock_runner._is_uuid = Mock(return_value=False)
-        mock_runner.send_request = Mock(return_value=(None, 200))
-
-        resolver = ParameterResolver(mock_runner)
-
-        # Act
-        result = resolver._resolve_to_list("/api/projects/", "test-project")
-
-        # Assert
-        assert result == []
+        assert result == expected
 
 
 class TestComplexIntegrationScenarios:
     """Test complex, real-world scenarios that combine multiple resolver features."""
 
-    def test_vm_creation_with_ports_and_security_groups(self):
+    def test_vm_creation_with_ports_and_security_groups(self, make_runner):
         """Test a complex VM creation scenario with ports, subnets, and security groups."""
         # Arrange
-        mock_runner = Mock()
-        mock_runner.module = Mock()
-        mock_runner.module.params = {
-            "offering": "openstack-offering",
-            "project": "test-project",
-        }
-        mock_runner.context = {
-            "resolvers": {
-                "offering": {
-                    "url": "/api/marketplace-offerings/",
-                    "error_message": "Offering '{value}' not found",
-                },
-                "project": {
-                    "url": "/api/projects/",
-                    "error_message": "Project '{value}' not found",
-                },
-                "subnet": {
-                    "url": "/api/subnets/",
-                    "error_message": "Subnet '{value}' not found",
-                    "filter_by": [
-                        {
-                            "source_param": "offering",
-                            "source_key": "scope_uuid",
-                            "target_key": "tenant_uuid",
-                        }
-                    ],
-                },
-                "security_groups": {
-                    "url": "/api/security-groups/",
-                    "error_message": "Security group '{value}' not found",
-                    "is_list": True,
-                    "list_item_keys": {"create": "url", "update_action": None},
-                    "filter_by": [
-                        {
-                            "source_param": "offering",
-                            "source_key": "scope_uuid",
-                            "target_key": "tenant_uuid",
-                        }
-                    ],
-                },
-            }
-        }
+        mock_runner = make_runner(
+            resolvers=VM_RESOLVERS,
+            params={
+                "offering": "openstack-offering",
+                "project": "test-project",
+            },
+        )
 
         # Mock the API responses
-        def mock_resolve_to_list(path, value, query_params=None, resolver_conf=None):
-            if "offerings" in path:
-                return [
-                    {
-                        "uuid": "offering-123",
-                        "scope_uuid": "tenant-456",
-                        "url": "/api/marketplace-offerings/offering-123/",
-                    }
-                ]
-            elif "projects" in path:
-                return [{"uuid": "project-789", "url": "/api/projects/project-789/"}]
-            elif "subnets" in path:
-                if value == "private-subnet-A":
-                    return [{"uuid": "subnet-123", "url": "/api/subnets/subnet-123/"}]
-                elif value == "private-subnet-B":
-                    return [{"uuid": "subnet-456", "url": "/api/subnets/subnet-456/"}]
-            elif "security-groups" in path:
-                if value == "sg-web":
-                    return [{"uuid": "sg-123", "url": "/api/security-groups/sg-123/"}]
-                elif value == "sg-db":
-                    return [{"uuid": "sg-456", "url": "/api/security-groups/sg-456/"}]
-                elif value == "sg-admin":
-                    return [{"uuid": "sg-789", "url": "/api/security-groups/sg-789/"}]
-            return []
-
-        mock_runner._is_uuid = Mock(return_value=False)
-
         resolver = ParameterResolver(mock_runner)
-        resolver._resolve_to_list = Mock(side_effect=mock_resolve_to_list)
+        # Hand out copies, as the resolver caches the objects it is given.
+        resolver._resolve_to_list = Mock(
+            side_effect=lambda path, value, *args, **kwargs: [
+                dict(item) for item in VM_LOOKUP_RESULTS.get((path, value), [])
+            ]
+        )
 
         # Complex input structure
         input_data = {
@@ -1107,40 +1147,20 @@ class TestComplexIntegrationScenarios:
         }
 
         # Act
-        # First resolve the dependencies to populate cache
-        resolver.resolve("offering", "openstack-offering")
-        resolver.resolve("project", "test-project")
+        # First resolve the dependencies from the module params to populate cache
+        for name, value in mock_runner.module.params.items():
+            resolver.resolve(name, value)
         # Then resolve the complex structure
         result = resolver.resolve("vm_config", input_data)
 
         # Assert
-        expected = {
-            "ports": [
-                {
-                    "subnet": "/api/subnets/subnet-123/",
-                    "security_groups": [
-                        {"url": "/api/security-groups/sg-123/"},
-                        {"url": "/api/security-groups/sg-456/"},
-                    ],
-                    "description": "Web server port",
-                },
-                {
-                    "subnet": "/api/subnets/subnet-456/",
-                    "security_groups": [{"url": "/api/security-groups/sg-789/"}],
-                    "description": "Admin port",
-                },
-            ]
-        }
-        assert result == expected
+        assert result == VM_EXPECTED
 
-    def test_update_scenario_with_cache_priming(self):
+    def test_update_scenario_with_cache_priming(self, make_runner):
         """Test an update scenario where cache is primed from existing resource."""
         # Arrange
-        mock_runner = Mock()
-        mock_runner.module = Mock()
-        mock_runner.module.params = {"subnet": "new-subnet"}  # Make params dict-like
-        mock_runner.context = {
-            "resolvers": {
+        mock_runner = make_runner(
+            resolvers={
                 "subnet": {
                     "url": "/api/subnets/",
                     "error_message": "Subnet '{value}' not found",
@@ -1152,34 +1172,24 @@ class TestComplexIntegrationScenarios:
                         }
                     ],
                 }
-            }
-        }
-
-        # Mock API responses
-        def mocksend_request(method, url, data=None):
-            if "offerings" in url:
-                return (
-                    {
-                        "uuid": "offering-123",
-                        "scope_uuid": "tenant-456",
-                        "name": "test-offering",
-                    },
-                    200,
-                )
-            return None
-
-        def mock_resolve_to_list(path, value, query_params=None, resolver_conf=None):
-            if "subnets" in path and value == "new-subnet":
-                # Ensure the query includes the tenant filter
-                if query_params and query_params.get("tenant_uuid") == "tenant-456":
-                    return [{"uuid": "subnet-new", "url": "/api/subnets/subnet-new/"}]
-            return []
+            },
+            params={"subnet": "new-subnet"},
+        )
 
-        mock_runner.send_request = Mock(side_effect=mocksend_request)
-        mock_runner._is_uuid = Mock(return_value=False)
+        # Mock the API response for the offering fetched while priming the cache
+        mock_runner.send_request = Mock(
+            return_value=(
+                {
+                    "uuid": "offering-123",
+                    "scope_uuid": "tenant-456",
+                    "name": "test-offering",
+                },
+                200,
+            )
+        )
 
         resolver = ParameterResolver(mock_runner)
-        resolver._resolve_to_list = Mock(side_effect=mock_resolve_to_list)
+        resolver._resolve_to_list = Mock(side_effect=_update_resolve_to_list)
 
         # Existing resource with offering URL
         existing_resource = {
@@ -1195,6 +1205,9 @@ class TestComplexIntegrationScenarios:
         result = resolver.resolve("subnet", "new-subnet")
 
         # Assert
+        mock_runner.send_request.assert_called_once_with(
+            "GET", "/api/marketplace-offerings/offering-123/"
+        )
         assert result == "/api/subnets/subnet-new/"
         # Verify that the dependency filter was applied correctly
         resolver._resolve_to_list.assert_called_with(
@@ -1204,20 +1217,17 @@ class TestComplexIntegrationScenarios:
             unittest.mock.ANY,
         )
 
-    def test_error_propagation_through_nested_resolution(self):
+    def test_error_propagation_through_nested_resolution(self, make_runner):
         """Test that errors in nested resolution are properly propagated."""
         # Arrange
-        mock_runner = Mock()
-        mock_runner.module = Mock()
-        mock_runner.module.params = {}
-        mock_runner.context = {
-            "resolvers": {
+        mock_runner = make_runner(
+            resolvers={
                 "subnet": {
                     "url": "/api/subnets/",
                     "error_message": "Subnet '{value}' not found",
                 }
             }
-        }
+        )
 
         resolver = ParameterResolver(mock_runner)
         resolver._resolve_to_list = Mock(return_value=[])  # No results found
@@ -1231,20 +1241,17 @@ class TestComplexIntegrationScenarios:
             msg="Subnet 'nonexistent-subnet' not found"
         )
 
-    def test_caching_prevents_duplicate_api_calls(self):
+    def test_caching_prevents_duplicate_api_calls(self, make_runner):
         """Test that caching prevents duplicate API calls for the same parameter."""
         # Arrange
-        mock_runner = Mock()
-        mock_runner.module = Mock()
-        mock_runner.module.params = {}
-        mock_runner.context = {
-            "resolvers": {
+        mock_runner = make_runner(
+            resolvers={
                 "subnet": {
                     "url": "/api/subnets/",
                     "error_message": "Subnet '{value}' not found",
                 }
             }
-        }
+        )
 
         resolver = ParameterResolver(mock_runner)
         resolver._build_dependency_filters = Mock(return_value={})
@@ -1252,7 +1259,7 @@ class TestComplexIntegrationScenarios:
             return_value=[{"uuid": "subnet-123", "url": "/api/subnets/subnet-123/"}]
         )
 
-        resolver_conf = resolver.context["resolvers"]["subnet"]
+        resolver_conf = resolver.resolvers["subnet"]
 
         # Act
         # Resolve the same parameter twice
@@ -1273,66 +1280,34 @@ class TestComplexIntegrationScenarios:
 class TestEdgeCasesAndErrorHandling:
     """Test edge cases, error conditions, and boundary scenarios."""
 
-    def test_resolve_none_value(self):
-        """Test resolving None values returns None unchanged."""
-        # Arrange
-        mock_runner = Mock()
-        mock_runner.module = Mock()
-        mock_runner.context = {"resolvers": {}}
-
-        resolver = ParameterResolver(mock_runner)
-
+    @pytest.mark.parametrize(
+        "value",
+        [
+            pytest.param(None, id="none"),
+            pytest.param([], id="empty_list"),
+            pytest.param({}, id="empty_dict"),
+        ],
+    )
+    def test_resolve_empty_value(self, empty_resolver, value):
+        """Test resolving None and empty containers returns them unchanged."""
         # Act
-        result = resolver.resolve("any_param", None)
+        result = empty_resolver.resolve("any_param", value)
 
         # Assert
-        assert result is None
-
-    def test_resolve_empty_list(self):
-        """Test resolving empty lists returns empty list."""
-        # Arrange
-        mock_runner = Mock()
-        mock_runner.module = Mock()
-        mock_runner.context = {"resolvers": {}}
-
-        resolver = ParameterResolver(mock_runner)
+        assert result == value
+        assert type(result) is type(value)
 
-        # Act
-        result = resolver.resolve("any_param", [])
-
-        # Assert
-        assert result == []
-
-    def test_resolve_empty_dict(self):
-        """Test resolving empty dictionaries returns empty dict."""
-        # Arrange
-        mock_runner = Mock()
-        mock_runner.module = Mock()
-        mock_runner.module.params = {}
-        mock_runner.context = {"resolvers": {}}
-
-        resolver = ParameterResolver(mock_runner)
-
-        # Act
-        result = resolver.resolve("any_param", {})
-
-        # Assert
-        assert result == {}
-
-    def test_resolve_mixed_types_in_list(self):
+    def test_resolve_mixed_types_in_list(self, make_runner):
         """Test resolving lists with mixed primitive and object types."""
         # Arrange
-        mock_runner = Mock()
-        mock_runner.module = Mock()
-        mock_runner.module.params = {}
-        mock_runner.context = {
-            "resolvers": {
+        mock_runner = make_runner(
+            resolvers={
                 "subnet": {
                     "url": "/api/subnets/",
                     "error_message": "Subnet '{value}' not found",
                 }
             }
-        }
+        )
 
         resolver = ParameterResolver(mock_runner)
         resolver._resolve_single_value = Mock(return_value="/api/subnets/subnet-123/")
@@ -1353,73 +1328,52 @@ class TestEdgeCasesAndErrorHandling:
         ]
         assert result == expected
 
-    def test_deep_nesting_resolution(self):
+    def test_deep_nesting_resolution(self, make_runner):
         """Test resolution of deeply nested data structures."""
         # Arrange
-        mock_runner = Mock()
-        mock_runner.module = Mock()
-        mock_runner.module.params = {}
-        mock_runner.context = {
-            "resolvers": {
+        mock_runner = make_runner(
+            resolvers={
                 "subnet": {
                     "url": "/api/subnets/",
                     "error_message": "Subnet '{value}' not found",
                 }
             }
-        }
+        )
 
         resolver = ParameterResolver(mock_runner)
-        resolver._resolve_single_value = Mock(return_value="/api/subnets/subnet-123/")
-
-        # Very deeply nested structure
-        input_data = {
-            "level1": {"level2": {"level3": [{"level4": {"subnet": "deep-subnet"}}]}}
-        }
+        resolver._resolve_single_value = Mock(return_value=SUBNET_URL)
 
         # Act
-        result = resolver.resolve("deep_config", input_data)
+        result = resolver.resolve("deep_config", DEEP_INPUT)
 
         # Assert
-        expected = {
-            "level1": {
-                "level2": {
-                    "level3": [{"level4": {"subnet": "/api/subnets/subnet-123/"}}]
-                }
-            }
-        }
-        assert result == expected
+        assert result == DEEP_EXPECTED
 
-    def test_immutability_of_input_data(self):
+    def test_immutability_of_input_data(self, make_runner):
         """Test that the original input data is not modified during resolution."""
         # Arrange
-        mock_runner = Mock()
-        mock_runner.module = Mock()
-        mock_runner.module.params = {}
-        mock_runner.context = {
-            "resolvers": {
+        mock_runner = make_runner(
+            resolvers={
                 "subnet": {
                     "url": "/api/subnets/",
                     "error_message": "Subnet '{value}' not found",
                 }
             }
-        }
+        )
 
         resolver = ParameterResolver(mock_runner)
         resolver._resolve_single_value = Mock(return_value="/api/subnets/subnet-123/")
 
-        # Original input data
+        # Original input data, with a snapshot to compare against afterwards
         original_input = {"subnet": "test-subnet", "description": "Original port"}
-        input_copy = deepcopy(original_input)
+        snapshot = json.dumps(original_input, sort_keys=True)
 
         # Act
-        result = resolver.resolve("port", input_copy)
+        result = resolver.resolve("port", original_input)
 
         # Assert
         # Original input should be unchanged
-        assert original_input == {
-            "subnet": "test-subnet",
-            "description": "Original port",
-        }
+        assert json.dumps(original_input, sort_keys=True) == snapshot
         # Result should be different
         expected = {
             "subnet": "/api/subnets/subnet-123/",
@@ -1428,16 +1382,9 @@ class TestEdgeCasesAndErrorHandling:
         assert result == expected
         assert result != original_input
 
-    def test_numeric_and_boolean_values_preserved(self):
+    def test_numeric_and_boolean_values_preserved(self, empty_resolver):
         """Test that numeric and boolean values are preserved during resolution."""
         # Arrange
-        mock_runner = Mock()
-        mock_runner.module = Mock()
-        mock_runner.module.params = {}
-        mock_runner.context = {"resolvers": {}}
-
-        resolver = ParameterResolver(mock_runner)
-
         input_data = {
             "cpu_count": 4,
             "memory_gb": 8.5,
@@ -1448,7 +1395,7 @@ class TestEdgeCasesAndErrorHandling:
         }
 
         # Act
-        result = resolver.resolve("vm_spec", input_data)
+        result = empty_resolver.resolve("vm_spec", input_data)
 
         # Assert
         # All values should be preserved exactly
@@ -1462,21 +1409,19 @@ class TestEdgeCasesAndErrorHandling:
 class TestPerformanceAndOptimization:
     """Test performance-related aspects and optimizations."""
 
-    def test_uuid_optimization_avoids_search(self):
+    def test_uuid_optimization_avoids_search(self, make_runner):
         """Test that UUID resolution bypasses search API calls."""
         # Arrange
-        mock_runner = Mock()
-        mock_runner.module = Mock()
-        mock_runner.module.params = {"api_url": "http://127.0.0.1:8000"}
-        mock_runner.context = {
-            "resolvers": {
+        mock_runner = make_runner(
+            resolvers={
                 "project": {
                     "url": "/api/projects/",
                     "error_message": "Project '{value}' not found",
                 }
-            }
-        }
-        mock_runner._is_uuid = Mock(return_value=True)
+            },
+            params={"api_url": "http://127.0.0.1:8000"},
+            is_uuid=True,
+        )
         mock_runner.send_request = Mock()  # Should not be called
 
         resolver = ParameterResolver(mock_runner)
@@ -1494,20 +1439,17 @@ class TestPerformanceAndOptimization:
         # No API calls should have been made
         mock_runner.send_request.assert_not_called()
 
-    def test_cache_hit_avoids_api_call(self):
+    def test_cache_hit_avoids_api_call(self, make_runner):
         """Test that cache hits avoid redundant API calls."""
         # Arrange
-        mock_runner = Mock()
-        mock_runner.module = Mock()
-        mock_runner.module.params = {}
-        mock_runner.context = {
-            "resolvers": {
+        mock_runner = make_runner(
+            resolvers={
                 "subnet": {
                     "url": "/api/subnets/",
                     "error_message": "Subnet '{value}' not found",
                 }
             }
-        }
+        )
 
         resolver = ParameterResolver(mock_runner)
         # Pre-populate cache
@@ -1520,7 +1462,7 @@ class TestPerformanceAndOptimization:
 
         # Act
         result = resolver._resolve_single_value(
-            "subnet", "cached-subnet", resolver.context["resolvers"]["subnet"]
+            "subnet", "cached-subnet", resolver.resolvers["subnet"]
         )
 
         # Assert
@@ -1534,14 +1476,11 @@ class TestOptionalDependencyResolution:
     applies filters when a dependency is provided but does not fail when it is omitted.
     """
 
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup_resolver(self, make_runner):
         """A helper to set up a common mock runner and resolver for these tests."""
-        self.mock_runner = Mock()
-        self.mock_runner.module = Mock()
-        # Make params dict-like for .get() calls
-        self.mock_runner.module.params = {}
-        self.mock_runner.context = {
-            "resolvers": {
+        self.mock_runner = make_runner(
+            resolvers={
                 "customer": {
                     "url": "/api/customers/",
                     "error_message": "Customer '{value}' not found",
@@ -1558,8 +1497,7 @@ class TestOptionalDependencyResolution:
                     ],
                 },
             }
-        }
-        self.mock_runner._is_uuid = Mock(return_value=False)
+        )
         self.resolver = ParameterResolver(self.mock_runner)
 
     def test_resolve_dependent_param_with_dependency_provided(self):
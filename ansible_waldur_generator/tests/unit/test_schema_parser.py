@@ -200,6 +200,29 @@ class TestReturnBlockGenerator:
 
         assert result is None
 
+    def test_get_schema_by_ref_returns_independent_copy(self, generator):
+        """Test that mutating a resolved reference does not leak into the spec."""
+        result = generator._get_schema_by_ref("#/components/schemas/Customer")
+        result["properties"]["uuid"]["format"] = "mutated"
+        result["required"].append("mutated")
+
+        original = generator.full_api_spec["components"]["schemas"]["Customer"]
+        assert original["properties"]["uuid"]["format"] == "uuid"
+        assert "mutated" not in original["required"]
+
+    def test_name_sample_uses_resource_type(self, generator):
+        """Test that the 'name' sample is derived from the resource type."""
+        schema = {"type": "string"}
+
+        assert (
+            generator._generate_sample_value("name", schema, "security group")
+            == "My-Awesome-security-group"
+        )
+        assert (
+            generator._generate_sample_value("name", schema, None)
+            == "My-Awesome-Resource"
+        )
+
     def test_type_mapping(self, generator):
         """Test OpenAPI to Ansible type mapping."""
         customer_schema = generator.full_api_spec["components"]["schemas"]["Customer"]
@@ -95,3 +95,23 @@ def test_http_error_still_fails_task(mock_fetch_url, mock_ansible_module):
         runner.send_request("GET", "/api/openstack-instances/")
 
     mock_ansible_module.fail_json.assert_called_once()
+
+
+@patch("ansible_waldur_generator.interfaces.runner.fetch_url")
+def test_request_headers_are_built_once(mock_fetch_url, mock_ansible_module):
+    """The standard request headers are reused across requests of a runner."""
+    empty_response = MagicMock()
+    empty_response.read.return_value = b"[]"
+    mock_fetch_url.return_value = (empty_response, {"status": 200})
+
+    runner = _make_runner(mock_ansible_module)
+    runner.send_request("GET", "/api/openstack-instances/")
+    runner.send_request("GET", "/api/openstack-volumes/")
+
+    first_headers = mock_fetch_url.call_args_list[0].kwargs["headers"]
+    second_headers = mock_fetch_url.call_args_list[1].kwargs["headers"]
+    assert first_headers is second_headers
+    assert first_headers == {
+        "Authorization": "token dummy-token",
+        "Content-Type": "application/json",
+    }